@@ -43,6 +43,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'jobs.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -55,6 +56,28 @@ MIDDLEWARE = [
     'jobs.middleware.ActiveUserMiddleware',
 ]
 
+# 'ratelimit' holds the login failure counters (jobs/utils/rate_limit.py). The file cache is for
+# development only: its incr() is not atomic, so concurrent workers can lose counts. Production
+# needs a shared backend with atomic incr (redis/memcached)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'ratelimit': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache' / 'ratelimit',
+        'TIMEOUT': 360,
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+LOGIN_RATE_LIMIT = {
+    "MAX_ATTEMPTS": 5,
+    "WINDOW": 180,  # seconds
+    # set to the number of reverse proxies (or their addresses) in front of the app,
+    # otherwise X-Forwarded-For is ignored and REMOTE_ADDR is used
+    "TRUSTED_PROXIES": 0,
+}
 
 ROOT_URLCONF = 'job_tracker.urls'
 
@@ -136,4 +159,45 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 DEFAULT_FROM_EMAIL = "no-reply@jobtracker.com"
 
 MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'
\ No newline at end of file
+MEDIA_ROOT = BASE_DIR / 'media'
+# Background workers for resume processing (jobs/utils/background.py)
+# 0 = run tasks inline in the calling process
+BACKGROUND_WORKERS = 2
+
+# Limits for PDF text extraction (jobs/utils/resume_parser.py), runs in a child process
+RESUME_EXTRACTION = {
+    "TIMEOUT": 20,      # seconds
+    "MAX_PAGES": 10,
+    "MEMORY_MB": 512,
+}
+
+# Background exports (jobs/utils/export_jobs.py): files live under MEDIA_ROOT/exports/
+EXPORT_TTL_HOURS = 24
+
+# Largest CSV accepted by the jobs/import/ page, in MB (the import_jobs command has no limit)
+IMPORT_MAX_UPLOAD_MB = 5
+
+# AdminActivity writes are buffered per process and bulk inserted (jobs/utils/activity.py),
+# at the latest when the request ends. MAX_EVENTS = 0 writes every event synchronously (tests, debugging)
+ACTIVITY_BUFFER = {
+    "MAX_EVENTS": 100,
+    "MAX_SECONDS": 2.0,
+}
+
+# Request timing (jobs.middleware.PerformanceMiddleware), see admin-dashboard/performance/
+PERFORMANCE = {
+    "SAMPLE_SIZE": 500,        # recent requests kept per url name
+    "SERVER_TIMING": "staff",  # Server-Timing header for staff only; True = everyone, False = off
+}
+
+# Prometheus endpoint (/metrics, jobs/utils/metrics.py). Each worker process snapshots its
+# metrics into DIR (local to the host) and a scrape sums them and deletes the files of exited
+# processes. Windows can't tell those apart, empty DIR there when deploying a new release
+METRICS = {
+    "DIR": BASE_DIR / '.metrics',
+    "WRITE_INTERVAL": 5,   # seconds
+    # scrapers allowed without a staff login, matched against the client ip as resolved with
+    # LOGIN_RATE_LIMIT['TRUSTED_PROXIES']. Behind a proxy on the same host every client looks
+    # like 127.0.0.1 unless TRUSTED_PROXIES is set, so don't list it then
+    "ALLOWED_IPS": [],
+}
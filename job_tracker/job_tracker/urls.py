@@ -17,18 +17,22 @@ Including another URLconf
 from django.contrib import admin
 from django.contrib.auth import views as auth_views
 from django.urls import path, include
-from jobs.views import resume_builder, signup, verify_email, home, job_list, job_detail, job_create, job_update, job_delete, export_jobs_csv, followup_list, upcoming_followups, stats_view, job_quick_status, job_quick_priority, job_followup_done, job_followup_quick_update, resume_upload, resume_checker_api, resume_job_match_api
-from jobs.views_admin import admin_dashboard, admin_job_list, admin_activity_timeline, admin_toggle_user_active, admin_export_jobs_csv
+from jobs.views import resume_builder, signup, verify_email, home, job_list, job_detail, job_create, job_update, job_delete, export_jobs_csv, followup_list, upcoming_followups, stats_view, job_quick_status, job_quick_priority, job_followup_done, job_followup_quick_update, resume_upload, resume_checker_api, resume_job_match_api, resume_job_match_batch_api, resume_rank_api, export_jobs_async, export_status, export_download, job_import, job_bulk_action
+from jobs.views_admin import admin_dashboard, admin_job_list, admin_activity_timeline, admin_toggle_user_active, admin_export_jobs_csv, admin_export_jobs_async, admin_analytics_export, admin_performance, metrics_view
 from django.conf import settings
 from django.conf.urls.static import static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
     path("admin-dashboard/", admin_dashboard, name="admin_dashboard"),
     path("admin-dashboard/jobs/", admin_job_list, name="admin_job_list"),
     path("admin-dashboard/activity/", admin_activity_timeline, name="admin_activity_timeline"),
     path("admin-dashboard/users/<int:user_id>/toggle/", admin_toggle_user_active,name="admin_toggle_user_active"),
     path("admin-dashboard/jobs/export/csv/", admin_export_jobs_csv, name="admin_export_jobs_csv"),
+    path("admin-dashboard/jobs/export/async/", admin_export_jobs_async, name="admin_export_jobs_async"),
+    path("admin-dashboard/performance/", admin_performance, name="admin_performance"),
+    path("admin-dashboard/analytics/<str:dataset>.ndjson", admin_analytics_export, name="admin_analytics_export"),
     
     path('accounts/', include('django.contrib.auth.urls')),
 
@@ -47,6 +51,10 @@ urlpatterns = [
     path('jobs/<int:pk>/edit/', job_update, name='job_update'),
     path('jobs/<int:pk>/delete/', job_delete, name='job_delete'),
     path('jobs/export/csv/', export_jobs_csv, name='export_jobs_csv'),
+    path('jobs/export/async/', export_jobs_async, name='export_jobs_async'),
+    path('jobs/import/', job_import, name='job_import'),
+    path('exports/<int:pk>/', export_status, name='export_status'),
+    path('exports/<int:pk>/download/', export_download, name='export_download'),
     path('jobs/followups/', followup_list, name='followup_list'),
     path('jobs/followups/upcoming/', upcoming_followups, name='upcoming_followups'),
     path('jobs/stats/', stats_view, name='stats'),
@@ -54,10 +62,13 @@ urlpatterns = [
     path('jobs/<int:pk>/priority/', job_quick_priority, name='job_quick_priority'),
     path('jobs/<int:pk>/followup/done/', job_followup_done, name='job_followup_done'),
     path('jobs/<int:pk>/followup/quick/', job_followup_quick_update, name='job_followup_quick_update'),
+    path('api/jobs/bulk/', job_bulk_action, name='job_bulk_action'),
 
     path('resume/upload/', resume_upload, name='resume_upload'),
     path('api/resume/check/', resume_checker_api, name='resume_checker_api'),
     path("api/resume/match/<int:job_id>/", resume_job_match_api, name="resume_job_match_api"),
+    path("api/resume/match/batch/", resume_job_match_batch_api, name="resume_job_match_batch_api"),
+    path("api/resume/rank/", resume_rank_api, name="resume_rank_api"),
 
     path("resume/builder/", resume_builder, name="resume_builder"),
 
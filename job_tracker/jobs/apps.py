@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class JobsConfig(AppConfig):
@@ -7,3 +8,7 @@ class JobsConfig(AppConfig):
 
     def ready(self):
         import jobs.signals
+        post_migrate.connect(jobs.signals.install_job_search, sender=self)
+
+        from jobs.utils.perf import instrument_templates
+        instrument_templates()
@@ -1,4 +1,5 @@
 from django import forms
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
@@ -20,6 +21,18 @@ class JobForm(forms.ModelForm):
             raise ValidationError("Rejection reason is only allowed when status is 'Rejected'.")
         return cleaned_data
     
+class JobImportForm(forms.Form):
+    file = forms.FileField(help_text="CSV in the same layout as Export CSV.")
+
+    def clean_file(self):
+        f = self.cleaned_data['file']
+        if not f.name.lower().endswith('.csv'):
+            raise ValidationError("Please upload a .csv file.")
+        limit_mb = getattr(settings, "IMPORT_MAX_UPLOAD_MB", 5)
+        if f.size > limit_mb * 1024 * 1024:
+            raise ValidationError(f"File is too large (max {limit_mb} MB).")
+        return f
+
 class CustomUserCreationForm(UserCreationForm):
     email = forms.EmailField(required=True)
 
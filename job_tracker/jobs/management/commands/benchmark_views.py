@@ -0,0 +1,352 @@
+import json
+import logging
+import platform
+import sqlite3
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+import django
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+from django.urls import get_resolver, reverse
+from django.utils import timezone
+
+from jobs.models import AdminActivity, Job
+from jobs.utils import metrics, perf
+from jobs.utils.export_jobs import enqueue_export
+from jobs.utils.seed import USERNAME_PREFIX, seed_dataset
+
+# --preset values; explicit --users / --jobs-per-user / --activity win
+PRESETS = {
+    "small": {"users": 20, "jobs_per_user": 100, "activity": 10_000},
+    "medium": {"users": 200, "jobs_per_user": 250, "activity": 200_000},
+    "large": {"users": 1000, "jobs_per_user": 500, "activity": 1_000_000},
+}
+
+# url names that are deliberately not driven: they only hand off to views covered elsewhere
+# or need a token from an email
+SKIPPED_URLS = {"logout", "password_reset_done", "password_reset_complete", "password_change_done"}
+
+
+@dataclass
+class Case:
+    label: str
+    url_name: str
+    path: object               # str, or a callable returning one (run untimed before each request)
+    method: str = "get"
+    data: object = None
+    staff: bool = False
+    content_type: str = None
+    extra: dict = field(default_factory=dict)
+
+
+def build_cases(ctx):
+    """Every named route in job_tracker/urls.py against the seeded data. ctx holds the ids picked in handle()."""
+    user_id, job_id, other_job_id = ctx["user_id"], ctx["job_id"], ctx["other_job_id"]
+    today = timezone.localdate()
+    json_body = {"content_type": "application/json"}
+
+    def fresh_job():
+        job = Job.objects.create(user_id=user_id, title="Benchmark scratch", company="Bench", status="applied",
+                                 apply_date=today)
+        return reverse("job_delete", args=[job.pk])
+
+    # quick edits flip between two values so every request really changes the row
+    toggle = {"status": ["interview", "applied"], "priority": ["high", "low"]}
+
+    def alternate(key):
+        values = toggle[key]
+        values.reverse()
+        return values[0]
+
+    return [
+        Case("home", "home", reverse("home")),
+        Case("job_list", "job_list", reverse("job_list")),
+        Case("job_list ?q=python", "job_list", reverse("job_list") + "?q=python"),
+        Case("job_list ?status=interview&sort=priority", "job_list", reverse("job_list") + "?status=interview&sort=priority"),
+        Case("job_list ?follow=overdue", "job_list", reverse("job_list") + "?follow=overdue"),
+        Case("job_detail", "job_detail", reverse("job_detail", args=[job_id])),
+        Case("job_create GET", "job_create", reverse("job_create")),
+        Case("job_create POST", "job_create", reverse("job_create"), "post", {
+            "title": "Benchmark Engineer", "company": "Bench", "status": "applied", "priority": "medium",
+            "apply_date": today.isoformat(), "source": "other",
+        }),
+        Case("job_update GET", "job_update", reverse("job_update", args=[job_id])),
+        Case("job_update POST", "job_update", reverse("job_update", args=[other_job_id]), "post", {
+            "title": "Backend Engineer", "company": "Globex", "status": "interview", "priority": "high",
+            "apply_date": (today - timedelta(days=10)).isoformat(),
+            "follow_up_date": (today + timedelta(days=3)).isoformat(), "source": "linkedin",
+        }),
+        Case("job_delete GET", "job_delete", reverse("job_delete", args=[job_id])),
+        Case("job_delete POST", "job_delete", fresh_job, "post"),
+        Case("export_jobs_csv", "export_jobs_csv", reverse("export_jobs_csv")),
+        Case("export_jobs_async", "export_jobs_async", reverse("export_jobs_async"), "post", {"format": "ndjson"}),
+        Case("export_status", "export_status", reverse("export_status", args=[ctx["export_id"]])),
+        Case("export_download", "export_download", reverse("export_download", args=[ctx["export_id"]])),
+        Case("job_import GET", "job_import", reverse("job_import")),
+        Case("followup_list", "followup_list", reverse("followup_list")),
+        Case("upcoming_followups", "upcoming_followups", reverse("upcoming_followups")),
+        Case("stats", "stats", reverse("stats")),
+        Case("job_quick_status json", "job_quick_status", reverse("job_quick_status", args=[job_id]) + "?fragment=json",
+             "post", lambda: {"status": alternate("status")}),
+        Case("job_quick_priority html", "job_quick_priority", reverse("job_quick_priority", args=[job_id]) + "?fragment=html",
+             "post", lambda: {"priority": alternate("priority")}),
+        Case("job_followup_quick_update", "job_followup_quick_update", reverse("job_followup_quick_update", args=[job_id]),
+             "post", {"follow_up_date": (today + timedelta(days=2)).isoformat()}),
+        Case("job_followup_done", "job_followup_done", reverse("job_followup_done", args=[job_id]), "post"),
+        Case("job_bulk_action", "job_bulk_action", reverse("job_bulk_action"), "post",
+             lambda: json.dumps({"filter": {"status": "applied"}, "priority": alternate("priority")}), **json_body),
+        Case("resume_upload GET", "resume_upload", reverse("resume_upload")),
+        Case("resume_checker_api", "resume_checker_api", reverse("resume_checker_api")),
+        Case("resume_job_match_api", "resume_job_match_api", reverse("resume_job_match_api", args=[job_id])),
+        Case("resume_job_match_batch_api", "resume_job_match_batch_api", reverse("resume_job_match_batch_api"), "post",
+             json.dumps({"filter": {"status": "interview"}}), **json_body),
+        Case("resume_rank_api", "resume_rank_api", reverse("resume_rank_api") + "?top=20"),
+        Case("resume_builder GET", "resume_builder", reverse("resume_builder")),
+        Case("admin_dashboard", "admin_dashboard", reverse("admin_dashboard"), staff=True),
+        Case("admin_job_list", "admin_job_list", reverse("admin_job_list"), staff=True),
+        Case("admin_job_list ?mode=users", "admin_job_list", reverse("admin_job_list") + "?mode=users", staff=True),
+        Case("admin_job_list ?q=engineer", "admin_job_list", reverse("admin_job_list") + "?q=engineer", staff=True),
+        Case("admin_activity_timeline", "admin_activity_timeline", reverse("admin_activity_timeline"), staff=True),
+        Case("admin_activity_timeline ?action=login", "admin_activity_timeline",
+             reverse("admin_activity_timeline") + "?action=login", staff=True),
+        Case("admin_toggle_user_active", "admin_toggle_user_active",
+             reverse("admin_toggle_user_active", args=[ctx["scratch_user_id"]]), staff=True),
+        Case("admin_export_jobs_csv ?user=", "admin_export_jobs_csv",
+             reverse("admin_export_jobs_csv") + f"?user={user_id}", staff=True),
+        Case("admin_export_jobs_async", "admin_export_jobs_async", reverse("admin_export_jobs_async"), "post",
+             {"format": "csv", "user": str(user_id)}, staff=True),
+        Case("admin_analytics_export activity", "admin_analytics_export",
+             reverse("admin_analytics_export", args=["activity"]) + f"?since_id={ctx['activity_since_id']}", staff=True),
+        Case("admin_performance", "admin_performance", reverse("admin_performance"), staff=True),
+        Case("metrics", "metrics", reverse("metrics"), staff=True),
+        Case("signup GET", "signup", reverse("signup"), extra={"anonymous": True}),
+        Case("verify_email bad token", "verify_email", reverse("verify_email", args=[user_id, "bad-token"]),
+             extra={"anonymous": True}),
+        Case("login GET", "login", reverse("login"), extra={"anonymous": True}),
+        Case("password_reset GET", "password_reset", reverse("password_reset"), extra={"anonymous": True}),
+        Case("password_reset_confirm bad token", "password_reset_confirm",
+             reverse("password_reset_confirm", args=["MQ", "bad-token"]), extra={"anonymous": True}),
+        Case("password_change GET", "password_change", reverse("password_change")),
+    ]
+
+
+def uncovered_urls(cases):
+    """Top-level url names that no case drives (namespaced apps like admin: are not checked)."""
+    names = {key for key in get_resolver().reverse_dict if isinstance(key, str)}
+    return sorted(names - {case.url_name for case in cases} - SKIPPED_URLS)
+
+
+def _consume(response):
+    # streaming views do their work while the body is read
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
+    if hasattr(response, "close"):
+        response.close()
+
+
+def _request(client, case):
+    path = case.path() if callable(case.path) else case.path
+    data = case.data() if callable(case.data) else case.data
+    kwargs = {"content_type": case.content_type} if case.content_type else {}
+    started = time.perf_counter()
+    response = getattr(client, case.method)(path, data, **kwargs) if data is not None else getattr(client, case.method)(path, **kwargs)
+    _consume(response)
+    return time.perf_counter() - started, response.status_code
+
+
+def measure(client, case, iterations, warmup):
+    """Timed runs, then one run counting queries and one under tracemalloc,
+       so neither instrument skews the latencies."""
+    for _ in range(warmup):
+        _request(client, case)
+    durations, statuses = [], set()
+    for _ in range(iterations):
+        elapsed, status = _request(client, case)
+        durations.append(elapsed)
+        statuses.add(status)
+
+    # an execute_wrapper rather than CaptureQueriesContext: request_started resets queries_log
+    queries = []
+    with connection.execute_wrapper(lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+        _request(client, case)
+
+    tracemalloc.start()
+    try:
+        _request(client, case)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    durations.sort()
+    return {
+        "url_name": case.url_name,
+        "method": case.method.upper(),
+        "status": sorted(statuses),
+        "iterations": iterations,
+        "p50_ms": round(perf.percentile(durations, 50) * 1000, 3),
+        "p95_ms": round(perf.percentile(durations, 95) * 1000, 3),
+        "mean_ms": round(statistics.fmean(durations) * 1000, 3),
+        "queries": len(queries),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """Regressions against a stored run: p95 or peak memory up by more than threshold percent
+       (and p95 by at least min_delta_ms), or any extra query."""
+    regressions = []
+    factor = 1 + threshold / 100
+    for label, result in results.items():
+        old = baseline.get(label)
+        if old is None:
+            continue
+        if result["p95_ms"] > old["p95_ms"] * factor and result["p95_ms"] - old["p95_ms"] >= min_delta_ms:
+            regressions.append(f"{label}: p95 {old['p95_ms']:.1f} -> {result['p95_ms']:.1f} ms")
+        if result["queries"] > old["queries"]:
+            regressions.append(f"{label}: queries {old['queries']} -> {result['queries']}")
+        if result["peak_kb"] > old["peak_kb"] * factor and result["peak_kb"] - old["peak_kb"] >= 64:
+            regressions.append(f"{label}: peak memory {old['peak_kb']:.0f} -> {result['peak_kb']:.0f} KB")
+    return regressions
+
+
+class Command(BaseCommand):
+    help = ("Seed a throwaway database, request every url in job_tracker/urls.py through the test client and "
+            "report p50/p95 latency, query count and peak memory per view. Optionally compare to a baseline JSON.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--preset", choices=sorted(PRESETS), default="small", help="Dataset size (default: small).")
+        parser.add_argument("--users", type=int, help="Seeded users (overrides the preset).")
+        parser.add_argument("--jobs-per-user", type=int, help="Jobs per seeded user (overrides the preset).")
+        parser.add_argument("--activity", type=int, help="AdminActivity rows (overrides the preset).")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for the dataset.")
+        parser.add_argument("--iterations", type=int, default=20, help="Timed requests per case.")
+        parser.add_argument("--warmup", type=int, default=2, help="Untimed requests per case before timing.")
+        parser.add_argument("--only", action="append", default=[], help="Only cases whose label contains this (repeatable).")
+        parser.add_argument("--db-file", help="SQLite file for the benchmark database (default: in memory).")
+        parser.add_argument("--keepdb", action="store_true", help="With --db-file, reuse an already seeded database.")
+        parser.add_argument("--output", help="Write the results as JSON here.")
+        parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against.")
+        parser.add_argument("--threshold", type=float, default=20.0, help="Allowed slowdown in percent (default: 20).")
+        parser.add_argument("--min-delta-ms", type=float, default=2.0,
+                            help="Ignore p95 slowdowns smaller than this, fast views are noisy (default: 2).")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("benchmark_views builds its throwaway database with SQLite only.")
+        sizes = {key: options[key] if options[key] is not None else value for key, value in PRESETS[options["preset"]].items()}
+        baseline = None
+        if options["baseline"]:
+            try:
+                with open(options["baseline"]) as fh:
+                    baseline = json.load(fh)["results"]
+            except (OSError, ValueError, KeyError) as e:
+                raise CommandError(f"Could not read baseline {options['baseline']}: {e}")
+
+        if options["db_file"]:
+            connection.settings_dict.setdefault("TEST", {})["NAME"] = options["db_file"]
+        setup_test_environment()
+        # 4xx cases (bad tokens) are expected, keep "Bad Request" warnings out of the report
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+        old_config = setup_databases(verbosity=0, interactive=False, keepdb=options["keepdb"])
+        try:
+            with tempfile.TemporaryDirectory() as media_root, override_settings(
+                MEDIA_ROOT=media_root,
+                BACKGROUND_WORKERS=0,               # exports run inline, inside the request being timed
+                ACTIVITY_BUFFER={"MAX_EVENTS": 0},  # write activity in the request so query counts are stable
+                METRICS={"DIR": None},
+            ):
+                results, meta = self.run_benchmark(sizes, options)
+        finally:
+            # benchmark traffic must not end up in the real /metrics snapshots
+            metrics.reset()
+            perf.reset()
+            teardown_databases(old_config, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        self.report(results)
+        if options["output"]:
+            with open(options["output"], "w") as fh:
+                json.dump({"meta": meta, "results": results}, fh, indent=2, sort_keys=True)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if baseline is not None:
+            regressions = compare(results, baseline, options["threshold"], options["min_delta_ms"])
+            for line in regressions:
+                self.stdout.write(self.style.ERROR(f"REGRESSION {line}"))
+            if regressions:
+                raise CommandError(f"{len(regressions)} regression(s) against {options['baseline']}.")
+            self.stdout.write(self.style.SUCCESS(f"No regressions against {options['baseline']}."))
+
+    def run_benchmark(self, sizes, options):
+        seeded = User.objects.filter(username__startswith=USERNAME_PREFIX).order_by("pk")
+        started = time.perf_counter()
+        if options["keepdb"] and seeded.exists():
+            self.stdout.write(f"Reusing {seeded.count()} seeded users from {options['db_file']}")
+        else:
+            self.stdout.write("Seeding {users} users x {jobs_per_user} jobs, {activity} activity rows...".format(**sizes))
+            seed_dataset(sizes["users"], sizes["jobs_per_user"], sizes["activity"], seed=options["seed"], staff=1)
+        seed_seconds = time.perf_counter() - started
+
+        staff = seeded.filter(is_staff=True).first()
+        user = seeded.filter(is_staff=False).first()
+        if staff is None or user is None:
+            raise CommandError("Need at least 2 seeded users (one staff, one regular).")
+        job_ids = list(Job.objects.filter(user=user).order_by("pk").values_list("pk", flat=True)[:2])
+        if len(job_ids) < 2:
+            raise CommandError("Need at least 2 jobs per user.")
+        scratch, _ = User.objects.get_or_create(username="benchmark_scratch")
+        last_activity = AdminActivity.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+        export = enqueue_export(user, "user", "csv", {})  # runs inline, so it's ready for status/download
+
+        ctx = {
+            "user_id": user.pk, "job_id": job_ids[0], "other_job_id": job_ids[1], "export_id": export.pk,
+            "scratch_user_id": scratch.pk, "activity_since_id": max(last_activity - 5000, 0),
+        }
+        cases = build_cases(ctx)
+        missing = uncovered_urls(cases)
+        if missing:
+            self.stdout.write(self.style.WARNING(f"Not benchmarked: {', '.join(missing)}"))
+        if options["only"]:
+            cases = [case for case in cases if any(part in case.label for part in options["only"])]
+
+        clients = {"user": Client(), "staff": Client(), "anonymous": Client()}
+        clients["user"].force_login(user)
+        clients["staff"].force_login(staff)
+
+        results = {}
+        for case in cases:
+            client = clients["anonymous" if case.extra.get("anonymous") else "staff" if case.staff else "user"]
+            results[case.label] = measure(client, case, options["iterations"], options["warmup"])
+            if any(status >= 500 for status in results[case.label]["status"]):
+                self.stdout.write(self.style.ERROR(f"{case.label}: server error {results[case.label]['status']}"))
+
+        meta = {
+            **sizes,
+            "seed": options["seed"],
+            "seed_seconds": round(seed_seconds, 1),
+            "iterations": options["iterations"],
+            "warmup": options["warmup"],
+            "jobs_total": Job.objects.count(),
+            "activity_total": AdminActivity.objects.count(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "finished_at": timezone.now().isoformat(),
+        }
+        return results, meta
+
+    def report(self, results):
+        width = max((len(label) for label in results), default=10)
+        self.stdout.write(f"{'view':<{width}}  {'p50 ms':>8}  {'p95 ms':>8}  {'queries':>7}  {'peak KB':>9}  status")
+        for label, r in sorted(results.items(), key=lambda item: item[1]["p95_ms"], reverse=True):
+            self.stdout.write(f"{label:<{width}}  {r['p50_ms']:>8.1f}  {r['p95_ms']:>8.1f}  {r['queries']:>7}  "
+                              f"{r['peak_kb']:>9.0f}  {','.join(map(str, r['status']))}")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from jobs.utils.export_jobs import cleanup_exports
+
+
+class Command(BaseCommand):
+    help = "Delete expired background exports and their files (run from cron)."
+
+    def handle(self, *args, **options):
+        removed = cleanup_exports()
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} expired export(s)."))
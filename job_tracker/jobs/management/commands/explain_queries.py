@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from jobs.models import AdminActivity, Job
+from jobs.utils.job_filters import filter_jobs
+
+# tables that must never be read with a full scan by the queries below
+CHECKED_TABLES = ("jobs_job", "jobs_adminactivity")
+
+
+def view_queries(user_id, today):
+    """(label, queryset) pairs mirroring the filters the views run."""
+    jobs = Job.objects.filter(user_id=user_id)
+    week_end = today + timedelta(days=6)
+    return [
+        ("job_list status", filter_jobs(jobs, {"status": "interview"}, today).order_by("id")),
+        ("job_list date=week", filter_jobs(jobs, {"date": "week"}, today).order_by("-apply_date")),
+        ("job_list follow=today", filter_jobs(jobs, {"follow": "today"}, today)),
+        ("job_list follow=overdue", filter_jobs(jobs, {"follow": "overdue"}, today)),
+        ("stats_view applied this week", jobs.filter(status="applied", apply_date__range=[today - timedelta(days=today.weekday()), week_end])),
+        ("followup_list", jobs.filter(follow_up_date__lte=today, follow_up_done=False).exclude(status__in=["rejected", "offered"])),
+        ("upcoming_followups", jobs.filter(follow_up_date__gte=today, follow_up_date__lte=week_end, follow_up_done=False).order_by("follow_up_date")),
+        ("admin_dashboard follow today", Job.objects.filter(follow_up_date=today, follow_up_done=False)),
+        ("admin_dashboard follow overdue", Job.objects.filter(follow_up_date__lt=today, follow_up_done=False)),
+        ("admin_activity_timeline", AdminActivity.objects.order_by("-created_at", "-id")[:50]),
+        ("admin_activity_timeline user", AdminActivity.objects.filter(user_id=user_id).order_by("-created_at")[:50]),
+        ("admin_activity_timeline action", AdminActivity.objects.filter(action="login").order_by("-created_at")[:50]),
+    ]
+
+
+def full_scans(plan):
+    """Plan lines that scan one of the checked tables without an index."""
+    scans = []
+    for line in plan.splitlines():
+        line = line.strip(" |-`")
+        if line.startswith("SCAN") and "INDEX" not in line and any(t in line.split() for t in CHECKED_TABLES):
+            scans.append(line)
+    return scans
+
+
+class Command(BaseCommand):
+    help = "Run EXPLAIN QUERY PLAN for each view's queries and fail if any does a full table scan (SQLite)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="User id to plan the per-user queries for (default: first user).")
+        parser.add_argument("--verbose-plans", action="store_true", help="Print every plan, not only failures.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("explain_queries understands SQLite query plans only.")
+
+        user_id = options["user"] or User.objects.order_by("pk").values_list("pk", flat=True).first() or 0
+        failures = 0
+        for label, queryset in view_queries(user_id, timezone.localdate()):
+            plan = queryset.explain()
+            scans = full_scans(plan)
+            if scans:
+                failures += 1
+                self.stdout.write(self.style.ERROR(f"SCAN  {label}: {'; '.join(scans)}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"ok    {label}"))
+            if options["verbose_plans"] or scans:
+                self.stdout.write(f"      {plan}")
+
+        if failures:
+            raise CommandError(f"{failures} query shape(s) fall back to a table scan.")
@@ -0,0 +1,60 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.utils.analytics_export import (ANALYTICS_BATCH_SIZE, DATASETS, parquet_available, record_batches,
+                                         write_ndjson, write_parquet)
+
+
+class Command(BaseCommand):
+    help = ("Export Job / AdminActivity rows as NDJSON or Parquet for analytics. "
+            "With --state-file only rows newer than the last run are written.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dataset", choices=[*DATASETS, "all"], default="all")
+        parser.add_argument("--format", choices=["ndjson", "parquet"], default="ndjson")
+        parser.add_argument("--output-dir", default=".", help="Where the files are written.")
+        parser.add_argument("--since-id", type=int, default=None, help="Only rows with a greater id (overrides the state file).")
+        parser.add_argument("--state-file", help="JSON file holding the last exported id per dataset, updated after each run.")
+        parser.add_argument("--batch-size", type=int, default=ANALYTICS_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        fmt = options["format"]
+        if fmt == "parquet" and not parquet_available():
+            raise CommandError("Parquet export needs pyarrow (pip install pyarrow), or use --format ndjson.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        state_file = options["state_file"]
+        state = {}
+        if state_file and os.path.exists(state_file):
+            with open(state_file) as fh:
+                state = json.load(fh)
+
+        os.makedirs(options["output_dir"], exist_ok=True)
+        datasets = list(DATASETS) if options["dataset"] == "all" else [options["dataset"]]
+        for dataset in datasets:
+            since_id = options["since_id"] if options["since_id"] is not None else state.get(dataset, 0)
+            batches = record_batches(dataset, since_id, options["batch_size"])
+            # written under a temp name, renamed once complete so readers never see half a file
+            tmp_path = os.path.join(options["output_dir"], f".{dataset}_after_{since_id}.{fmt}.part")
+            if fmt == "parquet":
+                count, last_id = write_parquet(tmp_path, dataset, batches)
+            else:
+                with open(tmp_path, "w", encoding="utf-8") as fh:
+                    count, last_id = write_ndjson(fh, dataset, batches)
+
+            if not count:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                self.stdout.write(f"{dataset}: no rows after id {since_id}.")
+                continue
+            final_path = os.path.join(options["output_dir"], f"{dataset}_{since_id + 1}-{last_id}.{fmt}")
+            os.replace(tmp_path, final_path)
+            state[dataset] = last_id
+            self.stdout.write(self.style.SUCCESS(f"{dataset}: {count} row(s) -> {final_path}"))
+
+        if state_file:
+            with open(state_file, "w") as fh:
+                json.dump(state, fh)
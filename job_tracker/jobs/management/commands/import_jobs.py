@@ -0,0 +1,35 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.utils.job_import import IMPORT_BATCH_SIZE, import_jobs
+
+
+class Command(BaseCommand):
+    help = "Import jobs for a user from a CSV in the export_jobs_csv layout."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file to import.")
+        parser.add_argument("--user", required=True, help="Username or id of the owner.")
+        parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+        parser.add_argument("--dry-run", action="store_true", help="Validate and count, insert nothing.")
+
+    def handle(self, *args, **options):
+        lookup = {"pk": options["user"]} if options["user"].isdigit() else {"username": options["user"]}
+        user = User.objects.filter(**lookup).first()
+        if user is None:
+            raise CommandError(f"No user {options['user']!r}.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as fh:
+                result = import_jobs(fh, user, batch_size=options["batch_size"], dry_run=options["dry_run"])
+        except OSError as e:
+            raise CommandError(str(e))
+
+        for line, message in result.errors:
+            self.stderr.write(f"line {line}: {message}")
+        verb = "Would import" if options["dry_run"] else "Imported"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {result.created} of {result.rows} row(s): {result.duplicates} duplicate(s), {result.invalid} invalid."
+        ))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobs.models import UserProfile
+from jobs.utils.resume_pipeline import process_resume
+
+
+class Command(BaseCommand):
+    help = "Process pending resumes synchronously (backfill, or recovery after a worker restart)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--include-stuck", action="store_true", help="Also retry resumes left in 'processing' or 'failed'.")
+
+    def handle(self, *args, **options):
+        statuses = ["pending"]
+        if options["include_stuck"]:
+            statuses += ["processing", "failed"]
+
+        profiles = UserProfile.objects.filter(resume_status__in=statuses).exclude(resume="").exclude(resume__isnull=True)
+        done = 0
+        for profile_id in profiles.values_list("pk", flat=True).iterator():
+            UserProfile.objects.filter(pk=profile_id).update(resume_status="processing", resume_claimed_at=timezone.now())
+            process_resume(profile_id)
+            done += 1
+        self.stdout.write(self.style.SUCCESS(f"Processed {done} resume(s)."))
@@ -0,0 +1,47 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.models import JobStats
+
+COMPARED_FIELDS = ("total", "applied", "interview", "offered", "rejected", "high", "medium", "low",
+                   "follow_up_dates", "first_apply_date")
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-user JobStats rollup from the Job table, or verify it with --verify."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="Only this user id.")
+        parser.add_argument("--verify", action="store_true", help="Compare stored stats to a fresh count instead of rebuilding.")
+        parser.add_argument("--fix", action="store_true", help="With --verify, rebuild the rows that don't match.")
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by("pk")
+        if options["user"]:
+            users = users.filter(pk=options["user"])
+
+        mismatched = 0
+        checked = 0
+        for user_id in users.values_list("pk", flat=True).iterator():
+            checked += 1
+            if not options["verify"]:
+                JobStats.rebuild(user_id)
+                continue
+
+            fresh = JobStats.compute(user_id)
+            stored = JobStats.objects.filter(user_id=user_id).first()
+            if stored is None:
+                continue  # built lazily on first read, nothing to compare
+            diffs = [f for f in COMPARED_FIELDS if getattr(stored, f) != getattr(fresh, f)]
+            if diffs:
+                mismatched += 1
+                self.stdout.write(self.style.WARNING(f"user {user_id}: mismatch in {', '.join(diffs)}"))
+                if options["fix"]:
+                    fresh.save()
+
+        if not options["verify"]:
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {checked} user(s)."))
+        elif mismatched and not options["fix"]:
+            raise CommandError(f"{mismatched} of {checked} user(s) have stale stats.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Checked {checked} user(s), {mismatched} mismatch(es)."))
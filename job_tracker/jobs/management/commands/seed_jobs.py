@@ -0,0 +1,82 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from jobs.utils.seed import (
+    SEED_BATCH_SIZE, SEED_PASSWORD, USERNAME_PREFIX, next_seed_number, rebuild_stats, seed_activity, seed_jobs_for,
+    seed_resumes, seed_users,
+)
+
+
+class Command(BaseCommand):
+    help = ("Generate seed_user_* users with jobs across every status/priority/source, follow-ups, "
+            "AdminActivity history and sample resume PDFs, for benchmarking and index tuning. "
+            "Same --seed, same data (dates are relative to today).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100, help="Users to create (default: 100).")
+        parser.add_argument("--jobs-per-user", type=int, default=100, help="Jobs per user (default: 100).")
+        parser.add_argument("--activity", type=int, default=10_000, help="AdminActivity rows (default: 10000).")
+        parser.add_argument("--staff", type=int, default=1, help="How many of the new users are staff (default: 1).")
+        parser.add_argument("--resumes", type=int, default=3,
+                            help="Distinct sample resume PDFs shared round-robin by the users; 0 = no resumes.")
+        parser.add_argument("--unprocessed-resumes", action="store_true",
+                            help="Leave resumes pending for process_resumes instead of storing their text.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0).")
+        parser.add_argument("--batch-size", type=int, default=SEED_BATCH_SIZE)
+        parser.add_argument("--force", action="store_true", help="Seed even with DEBUG off.")
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options["force"]:
+            raise CommandError("Refusing to seed a DEBUG=False database, pass --force if you mean it.")
+        for name in ("users", "jobs_per_user", "activity", "staff", "resumes"):
+            if options[name] < 0:
+                raise CommandError(f"--{name.replace('_', '-')} can't be negative.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        if connection.vendor == "sqlite":
+            # throwaway data: skip the fsync per transaction, this connection only
+            with connection.cursor() as cursor:
+                cursor.execute("PRAGMA synchronous = OFF")
+
+        batch_size = options["batch_size"]
+        started = time.perf_counter()
+        first_number = next_seed_number()
+        user_ids = self.stage("users", options["users"], lambda progress: seed_users(
+            options["users"], start=first_number, batch_size=batch_size, staff=options["staff"]))
+        jobs, job_ids = self.stage("jobs", options["users"] * options["jobs_per_user"], lambda progress: seed_jobs_for(
+            user_ids, options["jobs_per_user"], seed=options["seed"], batch_size=batch_size, progress=progress))
+        activity = self.stage("activity", options["activity"], lambda progress: seed_activity(
+            user_ids, job_ids, options["activity"], seed=options["seed"], batch_size=batch_size, progress=progress))
+        resumes = self.stage("resumes", options["resumes"], lambda progress: seed_resumes(
+            user_ids, variants=options["resumes"], processed=not options["unprocessed_resumes"]))
+        self.stage("job stats", len(user_ids), lambda progress: rebuild_stats(user_ids))
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(user_ids)} user(s), {jobs} job(s), {activity} activity row(s) and "
+            f"{len(resumes)} resume file(s) in {elapsed:.1f}s."
+        ))
+        if user_ids:
+            first = f"{USERNAME_PREFIX}{first_number:07d}"
+            self.stdout.write(f"Log in as {first} / {SEED_PASSWORD}" + (" (staff)" if options["staff"] else ""))
+        if resumes and options["unprocessed_resumes"]:
+            self.stdout.write("Run `manage.py process_resumes` to extract the resumes.")
+
+    def stage(self, label, total, run):
+        """Run one seeding step, printing progress for the batched ones and the rate at the end."""
+        started = time.perf_counter()
+        done = 0
+
+        def progress(count):
+            nonlocal done
+            done += count
+            rate = done / max(time.perf_counter() - started, 1e-6)
+            self.stdout.write(f"  {label}: {done}/{total} ({rate:,.0f}/s)")
+
+        result = run(progress)
+        self.stdout.write(f"{label}: done in {time.perf_counter() - started:.1f}s")
+        return result
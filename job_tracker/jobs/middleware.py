@@ -1,12 +1,13 @@
 from django.shortcuts import redirect
 from django.urls import reverse
-import time
 from django.http import HttpResponseForbidden
-from django.contrib.auth import authenticate
 from django.contrib.auth import logout
+from django.conf import settings
+from django.db import connection
+import time
 
-MAX_ATTEMPTS = 5
-BLOCK_WINDOW = 180  # 3 minutes
+from jobs.utils import metrics, perf
+from jobs.utils.rate_limit import get_client_ip, is_limited
 
 class AdminStaffOnlyMiddleware:
     def __init__(self, get_response):
@@ -21,41 +22,18 @@ class AdminStaffOnlyMiddleware:
         return self.get_response(request)
     
 class LoginRateLimitMiddleware:
-    _ip_attempts = {}   # dictionary to track login attempts per IP
-
+    """Blocks the login page for clients with too many recent failures.
+       Failures are counted by the user_login_failed receiver (jobs/signals.py),
+       so a login POST is only authenticated once, by the login view itself."""
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        if request.path == "/accounts/login/": # Django login URL
-            ip = self.get_client_ip(request)
-            now = time.time()
-            attempts = self._ip_attempts.get(ip, [])
-
-            # keep only attempts inside time window
-            attempts = [t for t in attempts if now - t < BLOCK_WINDOW]
-            self._ip_attempts[ip] = attempts
-
-            if len(attempts) >= MAX_ATTEMPTS:
-                return HttpResponseForbidden("Too many login attempts. Please try again after 3 minute.")
-            
-            #count only failed attempts
-            if request.method == 'POST':
-                username = request.POST.get('username')
-                password = request.POST.get('password')
-
-                user = authenticate(username=username, password=password)
-                if user is None: #means Failed
-                    attempts.append(now)
-                    self._ip_attempts[ip] = attempts
+        if request.path == reverse("login") and is_limited(get_client_ip(request)):
+            metrics.inc("jobtracker_login_rate_limited_total")
+            return HttpResponseForbidden("Too many login attempts. Please try again after 3 minute.")
         return self.get_response(request)
     
-    def get_client_ip(self, request):
-        xff = request.META.get('HTTP_X_FORWARDED_FOR')
-        if xff:
-            ip = xff.split(',')[0]
-        return request.META.get('REMOTE_ADDR')
-    
 class ActiveUserMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -64,4 +42,37 @@ class ActiveUserMiddleware:
         if request.user.is_authenticated and not request.user.is_active:
             logout(request)
             return redirect("login")
-        return self.get_response(request)
\ No newline at end of file
+        return self.get_response(request)
+
+class PerformanceMiddleware:
+    """Times every request: wall clock, DB queries/time, template render and PDF
+       extraction. Feeds the admin performance page and adds a Server-Timing header.
+       Goes first in MIDDLEWARE so the other middleware is included in the total."""
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timings, token = perf.start_request()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(perf.db_wrapper):
+                response = self.get_response(request)
+        finally:
+            perf.end_request(token)
+        total = time.perf_counter() - started
+
+        match = request.resolver_match
+        route = match.view_name if match else "unresolved"
+        perf.record(route, total, timings)
+        metrics.observe("jobtracker_http_request_duration_seconds", total, {"route": route})
+        metrics.observe("jobtracker_http_request_queries", timings.queries, {"route": route})
+        if self.show_header(request):
+            response["Server-Timing"] = perf.server_timing(total, timings)
+        return response
+
+    def show_header(self, request):
+        mode = perf.perf_settings()["SERVER_TIMING"]
+        if mode == "staff":
+            user = getattr(request, "user", None)
+            return settings.DEBUG or bool(user and user.is_staff)
+        return bool(mode)
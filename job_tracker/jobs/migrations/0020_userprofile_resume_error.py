@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0019_resume_processing_results'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='resume_error',
+            field=models.CharField(blank=True, editable=False, max_length=30),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:13
+
+from django.db import migrations, models
+
+
+def reanalyze_resumes(apps, schema_editor):
+    # stored scores came from the old keyword check; the pipeline recomputes
+    # them from the cached text (no PDF parse) the next time the resume is requested
+    ResumeText = apps.get_model('jobs', 'ResumeText')
+    UserProfile = apps.get_model('jobs', 'UserProfile')
+    ResumeText.objects.update(score=None)
+    UserProfile.objects.filter(resume_status='ready').update(resume_status='pending')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0021_job_tokens'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumetext',
+            name='section_details',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(reanalyze_resumes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('jobs', '0022_resumetext_section_details'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='job_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total', models.IntegerField(default=0)),
+                ('applied', models.IntegerField(default=0)),
+                ('interview', models.IntegerField(default=0)),
+                ('offered', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+                ('high', models.IntegerField(default=0)),
+                ('medium', models.IntegerField(default=0)),
+                ('low', models.IntegerField(default=0)),
+                ('follow_up_dates', models.JSONField(blank=True, default=dict)),
+                ('first_apply_date', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0023_jobstats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='adminactivity',
+            index=models.Index(fields=['-created_at', '-id'], name='activity_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adminactivity',
+            index=models.Index(fields=['user', '-created_at'], name='activity_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adminactivity',
+            index=models.Index(fields=['action', '-created_at'], name='activity_action_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['user', 'status'], name='job_user_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('follow_up_done', False)), fields=['user', 'follow_up_date'], name='job_user_open_followup_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['user', 'apply_date'], name='job_user_apply_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('follow_up_done', False)), fields=['follow_up_date'], name='job_open_followup_idx'),
+        ),
+    ]
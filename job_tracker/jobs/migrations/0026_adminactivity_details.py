@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0025_exportjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adminactivity',
+            name='details',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='adminactivity',
+            name='action',
+            field=models.CharField(choices=[('login', 'User Logged In'), ('job_created', 'Job Created'), ('job_updated', 'Job Updated'), ('followup_done', 'Follow-up Done'), ('user_locked', 'User Locked'), ('user_unlocked', 'User Unlocked'), ('resume_uploaded', 'Resume Uploaded'), ('resume_updated', 'Resume Updated'), ('jobs_imported', 'Jobs Imported')], max_length=50),
+        ),
+    ]
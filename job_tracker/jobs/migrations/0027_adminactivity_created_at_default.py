@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:26
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0026_adminactivity_details'),
+    ]
+
+    # auto_now_add -> default is Python-side only, skip SQLite's full table rebuild
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='adminactivity',
+                    name='created_at',
+                    field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+                ),
+            ],
+        ),
+    ]
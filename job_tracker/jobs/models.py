@@ -1,7 +1,10 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from django.contrib.auth.models import User
 import os
+
+from jobs.utils.tokenizer import keyword_set
 # Create your models here.
 class Job(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -33,13 +36,61 @@ class Job(models.Model):
     salary_min = models.IntegerField(blank=True, null=True)
     salary_max = models.IntegerField(blank=True,null=True)
     follow_up_done = models.BooleanField(default=False)
+    tokens = models.JSONField(default=list, blank=True, editable=False) # normalized keywords for resume matching
+
+    class Meta:
+        # shaped after the view filters, see `manage.py explain_queries`
+        indexes = [
+            models.Index(fields=['user', 'status'], name='job_user_status_idx'),
+            # partial: every follow-up query also filters follow_up_done=False
+            models.Index(fields=['user', 'follow_up_date'], condition=models.Q(follow_up_done=False), name='job_user_open_followup_idx'),
+            models.Index(fields=['user', 'apply_date'], name='job_user_apply_date_idx'),
+            # admin dashboard counts open follow-ups across all users
+            models.Index(fields=['follow_up_date'], condition=models.Q(follow_up_done=False), name='job_open_followup_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.company}"
-    
+
+    MATCH_TEXT_FIELDS = ('title', 'company', 'notes', 'next_step')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        job = super().from_db(db, field_names, values)
+        # remember what the stored tokens were built from (deferred fields -> unknown)
+        if all(f in field_names for f in cls.MATCH_TEXT_FIELDS):
+            job._tokenized_text = job.match_text()
+        # and what JobStats currently counts this job as
+        if all(f in field_names for f in cls.STATS_FIELDS):
+            job._stats_state = job.stats_state()
+        return job
+
+    STATS_FIELDS = ('status', 'priority', 'follow_up_date', 'follow_up_done', 'apply_date')
+
+    def stats_state(self):
+        """The parts of a job JobStats counts: (status, priority, open follow-up date, apply date)."""
+        follow_up = None if self.follow_up_done else self.follow_up_date
+        return (self.status, self.priority, follow_up, self.apply_date)
+
+    def match_text(self):
+        return f"{self.title} {self.company} {self.notes or ''} {self.next_step or ''}"
+
+    def refresh_tokens(self):
+        """Re-tokenize only when the matched text changed since load. Returns True if it did."""
+        text = self.match_text()
+        if text == getattr(self, '_tokenized_text', None):
+            return False
+        self.tokens = keyword_set(text)
+        self._tokenized_text = text
+        return True
+
     def save(self, *args, **kwargs):
         if self.follow_up_done:
             self.follow_up_date = None
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or set(update_fields) & set(self.MATCH_TEXT_FIELDS):
+            if self.refresh_tokens() and update_fields is not None:
+                kwargs['update_fields'] = list(update_fields) + ['tokens']
         super().save(*args, **kwargs)
 
 class AdminActivity(models.Model):
@@ -52,12 +103,22 @@ class AdminActivity(models.Model):
         ("user_unlocked", "User Unlocked"),
         ("resume_uploaded", "Resume Uploaded"),
         ("resume_updated", "Resume Updated"),
+        ("jobs_imported", "Jobs Imported"),
     ]
     
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     action = models.CharField(max_length=50, choices=ACTION_CHOICES)
     job = models.ForeignKey("Job", null=True, blank=True, on_delete=models.SET_NULL)
-    created_at = models.DateTimeField(auto_now_add=True)
+    details = models.JSONField(blank=True, null=True) # e.g. import summary counts
+    # set when the event happens, not when the buffered writer flushes it (jobs/utils/activity.py)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='activity_created_idx'),
+            models.Index(fields=['user', '-created_at'], name='activity_user_created_idx'),
+            models.Index(fields=['action', '-created_at'], name='activity_action_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.action} - {self.created_at}"
@@ -67,24 +128,58 @@ def resume_upload_path(instance, filename):
     return f"resumes/user_{instance.user.id}/{filename}"
 
 class UserProfile(models.Model):
+    RESUME_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    ]
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
     resume = models.FileField(upload_to=resume_upload_path, blank=True, null=True)
+    resume_hash = models.CharField(max_length=64, blank=True, editable=False) # sha256 of resume content, filled lazily
+    resume_status = models.CharField(max_length=20, choices=RESUME_STATUS_CHOICES, default='pending', editable=False)
+    resume_error = models.CharField(max_length=30, blank=True, editable=False) # failure reason from jobs/utils/resume_parser.py
+    resume_claimed_at = models.DateTimeField(blank=True, null=True, editable=False) # when a worker took it on, see enqueue_resume()
     updated_at = models.DateTimeField(auto_now=True)
 
     def save(self, *args, **kwargs):
+        stale_hash = ""
         if self.pk:
             try:
                 old = UserProfile.objects.get(pk=self.pk)
+                if old.resume != self.resume:
+                    stale_hash = old.resume_hash
+                    self.resume_hash = ""  # new file -> cached text no longer applies
+                    self.resume_status = 'pending'
+                    self.resume_error = ""
                 if old.resume and old.resume != self.resume:
                     if old.resume and old.resume.path and os.path.isfile(old.resume.path):
                         os.remove(old.resume.path)
             except UserProfile.DoesNotExist:
                 pass
         super().save(*args, **kwargs)
+        # drop cached text nobody points at anymore
+        if stale_hash and not UserProfile.objects.filter(resume_hash=stale_hash).exists():
+            ResumeText.objects.filter(sha256=stale_hash).delete()
 
     def __str__(self):
         return self.user.username
     
+class ResumeText(models.Model):
+    # extracted resume text, stored once per unique file content
+    sha256 = models.CharField(max_length=64, unique=True)
+    text = models.TextField(blank=True)
+    tokens = models.JSONField(default=list, blank=True)
+    # filled by the background pipeline (jobs/utils/resume_pipeline.py)
+    score = models.IntegerField(blank=True, null=True)
+    sections_found = models.JSONField(default=list, blank=True)
+    missing_sections = models.JSONField(default=list, blank=True)
+    section_details = models.JSONField(default=dict, blank=True) # positions/confidence per section
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.sha256
+
 class ResumeBuilder(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     full_name = models.CharField(max_length=100)
@@ -98,4 +193,157 @@ class ResumeBuilder(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
-        return f"{self.user.username}'s Resume"
\ No newline at end of file
+        return f"{self.user.username}'s Resume"
+
+class JobStats(models.Model):
+    """Per-user counters for the dashboards, kept up to date from Job
+       save/delete signals (jobs/signals.py). A missing row means "not built
+       yet"; for_user() builds it on first read."""
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='job_stats')
+    total = models.IntegerField(default=0)
+    applied = models.IntegerField(default=0)
+    interview = models.IntegerField(default=0)
+    offered = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+    high = models.IntegerField(default=0)
+    medium = models.IntegerField(default=0)
+    low = models.IntegerField(default=0)
+    # open (not done) follow-ups per date: {"2026-01-31": 2}
+    follow_up_dates = models.JSONField(default=dict, blank=True)
+    first_apply_date = models.DateField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats for user {self.user_id}"
+
+    @classmethod
+    def for_user(cls, user):
+        stats = cls.objects.filter(user=user).first()
+        return stats if stats is not None else cls.rebuild(user)
+
+    @classmethod
+    def compute(cls, user):
+        """Fresh, unsaved stats straight from the Job table."""
+        jobs = Job.objects.filter(user=user)
+        counts = jobs.aggregate(
+            total=models.Count('id'),
+            first_apply_date=models.Min('apply_date'),
+            **{status: models.Count('id', filter=models.Q(status=status)) for status, _ in Job.STATUS_CHOICES},
+            **{priority: models.Count('id', filter=models.Q(priority=priority)) for priority, _ in Job.PRIORITY_CHOICES},
+        )
+        open_follow_ups = (jobs.filter(follow_up_done=False, follow_up_date__isnull=False)
+                           .values('follow_up_date').annotate(count=models.Count('id')))
+        counts['follow_up_dates'] = {row['follow_up_date'].isoformat(): row['count'] for row in open_follow_ups}
+        return cls(user_id=getattr(user, 'pk', user), **counts)
+
+    @classmethod
+    def rebuild(cls, user):
+        """Store fresh stats. update_or_create, so two first requests racing to build
+           the missing row don't hit the primary key with two INSERTs."""
+        fresh = cls.compute(user)
+        values = {f.attname: getattr(fresh, f.attname) for f in cls._meta.concrete_fields
+                  if f.attname not in ('user_id', 'updated_at')}
+        stats, _ = cls.objects.update_or_create(user_id=fresh.user_id, defaults=values)
+        return stats
+
+    @classmethod
+    def apply_changes(cls, user_id, changes):
+        """Apply job state transitions incrementally.
+           changes: iterable of (old_state, new_state) from Job.stats_state(); None = job didn't/doesn't exist."""
+        with transaction.atomic():
+            stats = cls.objects.select_for_update().filter(user_id=user_id).first()
+            if stats is None:
+                return  # never built (or user being deleted); for_user() will build it from scratch
+            recompute_first = False
+            for old, new in changes:
+                for state, sign in ((old, -1), (new, 1)):
+                    if state is None:
+                        continue
+                    status, priority, follow_up, apply_date = state
+                    stats.total += sign
+                    if status in ('applied', 'interview', 'offered', 'rejected'):
+                        setattr(stats, status, getattr(stats, status) + sign)
+                    if priority in ('high', 'medium', 'low'):
+                        setattr(stats, priority, getattr(stats, priority) + sign)
+                    if follow_up:
+                        key = follow_up.isoformat()
+                        remaining = stats.follow_up_dates.get(key, 0) + sign
+                        if remaining > 0:
+                            stats.follow_up_dates[key] = remaining
+                        else:
+                            stats.follow_up_dates.pop(key, None)
+                    if sign > 0:
+                        if stats.first_apply_date is None or apply_date < stats.first_apply_date:
+                            stats.first_apply_date = apply_date
+                    elif apply_date == stats.first_apply_date and (new is None or new[3] != apply_date):
+                        # only when the job actually moves off the earliest date
+                        recompute_first = True
+            if recompute_first:
+                stats.first_apply_date = Job.objects.filter(user_id=user_id).aggregate(d=models.Min('apply_date'))['d']
+            stats.save()
+
+    def as_counts(self, today):
+        """Same keys as jobs.utils.job_stats.job_counts(), minus the week window."""
+        today_key = today.isoformat()
+        return {
+            'total_all': self.total,
+            'total_applied': self.applied,
+            'total_interview': self.interview,
+            'total_offered': self.offered,
+            'total_rejected': self.rejected,
+            'total_high': self.high,
+            'total_medium': self.medium,
+            'total_low': self.low,
+            'follow_today': self.follow_up_dates.get(today_key, 0),
+            'follow_overdue': sum(count for day, count in self.follow_up_dates.items() if day < today_key),
+            'in_progress': self.applied + self.interview,
+            'first_apply_date': self.first_apply_date,
+        }
+
+class ExportJob(models.Model):
+    """A job export written to MEDIA_ROOT by a background worker
+       (jobs/utils/export_jobs.py), polled and downloaded by the requester."""
+    SCOPE_CHOICES = [
+        ('user', 'My Jobs'),
+        ('admin', 'All Users'),
+    ]
+    FORMAT_CHOICES = [
+        ('csv', 'CSV'),
+        ('ndjson', 'NDJSON'),
+    ]
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    ]
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='exports')
+    scope = models.CharField(max_length=10, choices=SCOPE_CHOICES, default='user')
+    format = models.CharField(max_length=10, choices=FORMAT_CHOICES, default='csv')
+    params = models.JSONField(default=dict, blank=True) # same filters the sync export views accept
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    rows_total = models.IntegerField(default=0)
+    rows_written = models.IntegerField(default=0)
+    file = models.FileField(upload_to='exports/', blank=True)
+    error = models.CharField(max_length=200, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    expires_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['expires_at'], name='export_expires_idx'),
+        ]
+
+    def __str__(self):
+        return f"Export {self.pk} ({self.format}) - {self.status}"
+
+    @property
+    def progress(self):
+        if self.status == 'ready':
+            return 100
+        return int(self.rows_written * 100 / self.rows_total) if self.rows_total else 0
+
+    def delete_file(self):
+        if self.file and os.path.isfile(self.file.path):
+            os.remove(self.file.path)
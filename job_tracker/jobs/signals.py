@@ -1,7 +1,43 @@
-from django.contrib.auth.signals import user_logged_in
+from django.contrib.auth.signals import user_logged_in, user_login_failed
+from django.db import connections
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from .models import AdminActivity
+from .models import Job, JobStats
+from .utils.activity import log_activity
+from .utils import metrics
+from .utils.rate_limit import get_client_ip, record_failure
+from .utils.search import install_fts
 
 @receiver(user_logged_in)
 def log_user_login(sender, request, user, **kwargs):
-    AdminActivity.objects.create(user=user, action="login", job=None)
\ No newline at end of file
+    log_activity(user, "login")
+
+@receiver(user_login_failed)
+def count_login_failure(sender, credentials, request=None, **kwargs):
+    metrics.inc("jobtracker_login_failures_total")
+    # feeds LoginRateLimitMiddleware; authenticate() calls without a request aren't rate limited
+    if request is not None:
+        record_failure(get_client_ip(request))
+
+@receiver(post_save, sender=Job)
+def update_job_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    new_state = instance.stats_state()
+    if created:
+        JobStats.apply_changes(instance.user_id, [(None, new_state)])
+    elif hasattr(instance, '_stats_state'):
+        if instance._stats_state != new_state:
+            JobStats.apply_changes(instance.user_id, [(instance._stats_state, new_state)])
+    else:
+        # loaded with deferred fields, we don't know what changed
+        JobStats.objects.filter(user_id=instance.user_id).delete()
+    instance._stats_state = new_state
+
+@receiver(post_delete, sender=Job)
+def update_job_stats_on_delete(sender, instance, **kwargs):
+    JobStats.apply_changes(instance.user_id, [(getattr(instance, '_stats_state', instance.stats_state()), None)])
+
+def install_job_search(sender, using, **kwargs):
+    # connected in JobsConfig.ready(); (re)creates the FTS5 index after migrations
+    install_fts(connections[using])
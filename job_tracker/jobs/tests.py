@@ -1,3 +1,35 @@
+import datetime
+import json
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
+
+from .models import Job
+
+
+class JobBulkActionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("bulk")
+        self.client.force_login(self.user)
+        self.job = Job.objects.create(user=self.user, title="Python Developer", company="Acme",
+                                      status="applied", apply_date=datetime.date(2026, 1, 5))
+
+    def post(self, payload):
+        return self.client.post(reverse("job_bulk_action"), json.dumps(payload), content_type="application/json")
+
+    def test_filter_update(self):
+        response = self.post({"filter": {"q": "python"}, "status": "interview"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["updated"], 1)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "interview")
 
-# Create your tests here.
+    def test_non_string_filter_value(self):
+        for value in (5, ["python"], {"q": "python"}):
+            with self.subTest(value=value):
+                response = self.post({"filter": {"q": value}, "status": "interview"})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("q", response.json()["error"])
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "applied")
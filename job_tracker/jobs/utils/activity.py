@@ -0,0 +1,169 @@
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import request_finished, request_started
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.dispatch import receiver
+from django.utils import timezone
+
+from jobs.models import AdminActivity, Job
+from jobs.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER = {
+    "MAX_EVENTS": 100,    # flush once this many events are waiting; 0 = write synchronously
+    "MAX_SECONDS": 2.0,   # or once the oldest waiting event is this old (processes without requests)
+}
+
+_lock = threading.Lock()
+_buffer = []
+_oldest = None
+_timer = None
+_serving = False  # set by the first request, from then on every flush runs on a request thread
+
+
+def _limits():
+    return {**DEFAULT_BUFFER, **getattr(settings, "ACTIVITY_BUFFER", {})}
+
+
+def log_activity(user, action, job=None, details=None):
+    """Record an AdminActivity event. Events are buffered in-process and written in
+       batches, at the latest when the request ends; created_at is taken now, so
+       ordering matches when things happened."""
+    _add([_event(user, action, job, details, timezone.now())])
+
+
+def log_activities(user, action, jobs, details=None):
+    """The same event for many jobs (ids or instances), e.g. a bulk edit."""
+    now = timezone.now()
+    _add([_event(user, action, job, details, now) for job in jobs])
+
+
+def _event(user, action, job, details, created_at):
+    return AdminActivity(
+        user_id=getattr(user, "pk", user), action=action,
+        job_id=getattr(job, "pk", job), details=details, created_at=created_at,
+    )
+
+
+def _add(events):
+    if not events:
+        return
+    limits = _limits()
+    if limits["MAX_EVENTS"] <= 0:
+        AdminActivity.objects.bulk_create(events)
+        metrics.inc("jobtracker_admin_activity_written_total", len(events))
+        return
+
+    global _oldest
+    with _lock:
+        _buffer.extend(events)
+        if _oldest is None:
+            _oldest = time.monotonic()
+        due = len(_buffer) >= limits["MAX_EVENTS"] or time.monotonic() - _oldest >= limits["MAX_SECONDS"]
+    if due:
+        if connection.in_atomic_block:
+            # deferred FK checks would fire at the caller's commit, flush after it instead
+            transaction.on_commit(flush)
+        else:
+            flush()
+    elif not _serving:
+        _schedule(limits["MAX_SECONDS"])
+
+
+def flush():
+    """Write every buffered event with one bulk insert. Returns how many were written."""
+    global _oldest
+    with _lock:
+        events = _buffer[:]
+        _buffer.clear()
+        _oldest = None
+    if not events:
+        return 0
+    try:
+        with transaction.atomic():
+            AdminActivity.objects.bulk_create(events)
+    except IntegrityError:
+        # a job was deleted while its event waited; keep the event, drop the link like SET_NULL would
+        live = set(Job.objects.filter(pk__in={e.job_id for e in events if e.job_id}).values_list("pk", flat=True))
+        for event in events:
+            if event.job_id not in live:
+                event.job_id = None
+        try:
+            with transaction.atomic():
+                AdminActivity.objects.bulk_create(events)
+        except IntegrityError:
+            logger.exception("Dropped %s activity event(s)", len(events))
+            return 0
+    metrics.inc("jobtracker_admin_activity_written_total", len(events))
+    return len(events)
+
+
+def _flush_from_timer():
+    global _timer
+    with _lock:
+        _timer = None
+    close_old_connections()
+    try:
+        flush()
+    except Exception:
+        logger.exception("Activity flush failed")
+    finally:
+        # timer threads keep their own connection, don't leak it
+        connection.close()
+
+
+def _schedule(delay):
+    """Make sure a quiet process without requests (management commands, workers)
+       still flushes within MAX_SECONDS."""
+    global _timer
+    with _lock:
+        if _timer is not None:
+            return
+        _timer = threading.Timer(delay, _flush_from_timer)
+        _timer.daemon = True
+        _timer.start()
+
+
+@receiver(request_started)
+def _on_request_started(**kwargs):
+    # a timer thread writes on its own connection, and with SQLite that fails (or makes the
+    # request fail) while a request holds the write lock; request_finished flushes instead
+    global _serving, _timer
+    _serving = True
+    with _lock:
+        timer, _timer = _timer, None
+    if timer is not None:
+        timer.cancel()
+
+
+@receiver(request_finished)
+def _on_request_finished(**kwargs):
+    if not pending():
+        return
+    # Django's own request_finished handler may already have closed the connection
+    reopened = connection.connection is None
+    try:
+        flush()
+    except Exception:
+        logger.exception("Activity flush failed")
+    finally:
+        if reopened:
+            connection.close()
+
+
+def pending():
+    with _lock:
+        return len(_buffer)
+
+
+@atexit.register
+def _flush_at_exit():
+    try:
+        flush()
+    except Exception:
+        logger.exception("Activity flush at shutdown failed")
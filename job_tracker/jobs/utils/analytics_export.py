@@ -0,0 +1,96 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from jobs.models import AdminActivity, Job
+from jobs.utils import metrics
+from jobs.utils.exports import chunked_rows
+
+ANALYTICS_BATCH_SIZE = 10000
+
+# dataset -> (model, columns); columns are values_list() fields, user__username is exported as username.
+# rows are picked up by id, so incremental pulls see new rows only, not edits to old ones
+DATASETS = {
+    "jobs": (Job, ["id", "user_id", "user__username", "title", "company", "status", "priority", "source",
+                   "apply_date", "follow_up_date", "follow_up_done", "salary_min", "salary_max"]),
+    "activity": (AdminActivity, ["id", "user_id", "user__username", "action", "job_id", "created_at"]),
+}
+
+# parquet column types, kept next to the columns above so the two can't drift far apart
+PARQUET_TYPES = {
+    "id": "int64", "user_id": "int64", "job_id": "int64", "salary_min": "int64", "salary_max": "int64",
+    "apply_date": "date32", "follow_up_date": "date32", "follow_up_done": "bool_",
+    "created_at": "timestamp_us",
+}
+
+
+def column_names(dataset):
+    return [field.split("__")[-1] for field in DATASETS[dataset][1]]
+
+
+def record_batches(dataset, since_id=0, batch_size=ANALYTICS_BATCH_SIZE):
+    """Rows with id > since_id in id order, as lists of tuples of at most batch_size.
+       One short query per batch (see chunked_rows), memory is bounded by one batch."""
+    model, fields = DATASETS[dataset]
+    count = 0
+    try:
+        for batch in chunked_rows(model.objects.filter(id__gt=since_id or 0), fields, batch_size):
+            count += len(batch)
+            yield batch
+    finally:
+        metrics.inc("jobtracker_export_rows_total", count, {"kind": "analytics"})
+
+
+def ndjson_batch(names, batch):
+    return "".join(json.dumps(dict(zip(names, row)), cls=DjangoJSONEncoder) + "\n" for row in batch)
+
+
+def write_ndjson(fh, dataset, batches):
+    """Returns (rows written, last id)."""
+    names = column_names(dataset)
+    count, last_id = 0, None
+    for batch in batches:
+        fh.write(ndjson_batch(names, batch))
+        count += len(batch)
+        last_id = batch[-1][0]
+    return count, last_id
+
+
+def parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _parquet_schema(pa, names):
+    types = {
+        "int64": pa.int64(), "date32": pa.date32(), "bool_": pa.bool_(),
+        "timestamp_us": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(name, types[PARQUET_TYPES[name]] if name in PARQUET_TYPES else pa.string()) for name in names])
+
+
+def write_parquet(path, dataset, batches):
+    """One row group per batch. Needs pyarrow; returns (rows written, last id)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    names = column_names(dataset)
+    schema = _parquet_schema(pa, names)
+    count, last_id = 0, None
+    writer = None
+    try:
+        for batch in batches:
+            columns = list(zip(*batch))
+            table = pa.Table.from_arrays([pa.array(col, type=schema.field(i).type) for i, col in enumerate(columns)], schema=schema)
+            if writer is None:
+                writer = pq.ParquetWriter(path, schema)
+            writer.write_table(table)
+            count += len(batch)
+            last_id = batch[-1][0]
+    finally:
+        if writer is not None:
+            writer.close()
+    return count, last_id
@@ -0,0 +1,38 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.BACKGROUND_WORKERS, thread_name_prefix="jobs-bg")
+        return _executor
+
+
+def _run(fn, *args, **kwargs):
+    close_old_connections()
+    try:
+        return fn(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed", getattr(fn, "__name__", fn))
+    finally:
+        # worker threads keep their own connection, don't leak it
+        connection.close()
+
+
+def submit(fn, *args, **kwargs):
+    """Run fn off the request path.
+       With BACKGROUND_WORKERS = 0 the task runs inline (handy for tests and management commands)."""
+    if not getattr(settings, "BACKGROUND_WORKERS", 0):
+        return fn(*args, **kwargs)
+    return _get_executor().submit(_run, fn, *args, **kwargs)
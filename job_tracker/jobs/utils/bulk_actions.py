@@ -0,0 +1,78 @@
+import datetime
+
+from django.db import transaction
+
+from jobs.models import Job, JobStats
+from jobs.utils.activity import log_activities
+from jobs.utils.job_filters import STATUSES
+
+BULK_ACTION_LIMIT = 5000  # ids per request, keeps the IN (...) list under SQLite's variable limit
+PRIORITIES = ('high', 'medium', 'low')
+
+
+class BulkActionError(ValueError):
+    pass
+
+
+def parse_actions(payload):
+    """Body keys -> [(field updates)], one UPDATE each. Same rules as the quick-edit
+       views and Job.save(): a done follow-up has no date, a new date reopens it."""
+    actions = []
+    if 'status' in payload:
+        if payload['status'] not in STATUSES:
+            raise BulkActionError("Invalid status")
+        actions.append({'status': payload['status']})
+    if 'priority' in payload:
+        if payload['priority'] not in PRIORITIES:
+            raise BulkActionError("Invalid priority")
+        actions.append({'priority': payload['priority']})
+    if payload.get('follow_up_done') and 'follow_up_date' in payload:
+        raise BulkActionError("Send either follow_up_done or follow_up_date, not both")
+    if payload.get('follow_up_done'):
+        actions.append({'follow_up_done': True, 'follow_up_date': None})
+    elif 'follow_up_date' in payload:
+        try:
+            date = datetime.date.fromisoformat(payload['follow_up_date']) if payload['follow_up_date'] else None
+        except (TypeError, ValueError):
+            raise BulkActionError("follow_up_date must be YYYY-MM-DD or null")
+        actions.append({'follow_up_date': date, 'follow_up_done': False})
+    if not actions:
+        raise BulkActionError("Nothing to change: send status, priority, follow_up_date or follow_up_done")
+    return actions
+
+
+def apply_bulk_actions(user, jobs, actions):
+    """Apply parsed actions to the user's jobs in the queryset with one UPDATE per action.
+       JobStats gets the deltas (update() sends no signals) and one activity event per job
+       goes through the buffered writer. Returns the number of jobs touched."""
+    with transaction.atomic():
+        rows = list(jobs.filter(user=user).order_by('id').values_list('id', *Job.STATS_FIELDS)[:BULK_ACTION_LIMIT + 1])
+        if len(rows) > BULK_ACTION_LIMIT:
+            raise BulkActionError(f"Too many jobs, at most {BULK_ACTION_LIMIT} per request")
+        if not rows:
+            return 0
+        ids = [row[0] for row in rows]
+
+        merged = {}
+        for fields in actions:
+            Job.objects.filter(pk__in=ids).update(**fields)
+            merged.update(fields)
+
+        changes = []
+        for job_id, *values in rows:
+            old = dict(zip(Job.STATS_FIELDS, values))
+            new = {**old, **merged}
+            if new != old:
+                changes.append((_state(old), _state(new)))
+        if changes:
+            JobStats.apply_changes(user.pk, changes)
+
+        action = 'followup_done' if merged.get('follow_up_done') and len(actions) == 1 else 'job_updated'
+        log_activities(user, action, ids)
+    return len(ids)
+
+
+def _state(fields):
+    # same shape as Job.stats_state()
+    follow_up = None if fields['follow_up_done'] else fields['follow_up_date']
+    return (fields['status'], fields['priority'], follow_up, fields['apply_date'])
@@ -0,0 +1,121 @@
+import logging
+import os
+import secrets
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.urls import reverse
+from django.utils import timezone
+
+from jobs.models import ExportJob
+from jobs.utils.background import submit
+from jobs.utils.exports import (ADMIN_JOB_COLUMNS, EXPORT_CHUNK_SIZE, JOB_COLUMNS, admin_export_queryset,
+                                csv_lines, export_rows, ndjson_lines, user_export_queryset)
+
+logger = logging.getLogger(__name__)
+
+# filters each scope accepts, anything else in the request is dropped
+EXPORT_PARAMS = {
+    "user": ("status", "q", "date", "follow"),
+    "admin": ("user",),
+}
+EXTENSIONS = {"csv": "csv", "ndjson": "ndjson"}
+
+
+def _ttl():
+    return timedelta(hours=getattr(settings, "EXPORT_TTL_HOURS", 24))
+
+
+def _lines(export):
+    if export.scope == "admin":
+        queryset, columns = admin_export_queryset(export.params), ADMIN_JOB_COLUMNS
+    else:
+        queryset, columns = user_export_queryset(export.user, export.params), JOB_COLUMNS
+    if export.format == "ndjson":
+        return queryset, ndjson_lines(columns, queryset)
+    return queryset, csv_lines(columns, export_rows(queryset, columns))
+
+
+def run_export(export_id):
+    """Write the export file in chunks, updating progress as it goes.
+       Runs in a background worker, never in the request."""
+    claimed = ExportJob.objects.filter(pk=export_id, status="pending").update(status="running")
+    if not claimed:
+        return
+    export = ExportJob.objects.select_related("user").get(pk=export_id)
+    name = f"exports/export_{export.pk}_{secrets.token_hex(8)}.{EXTENSIONS[export.format]}"
+    path = os.path.join(settings.MEDIA_ROOT, name)
+    try:
+        queryset, lines = _lines(export)
+        total = queryset.count()
+        ExportJob.objects.filter(pk=export_id).update(rows_total=total)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        written = 0
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            if export.format == "csv":
+                fh.write(next(lines))
+            buffer = []
+            for line in lines:
+                buffer.append(line)
+                if len(buffer) == EXPORT_CHUNK_SIZE:
+                    fh.write("".join(buffer))
+                    written += len(buffer)
+                    buffer = []
+                    ExportJob.objects.filter(pk=export_id).update(rows_written=written)
+            fh.write("".join(buffer))
+            written += len(buffer)
+        now = timezone.now()
+        ExportJob.objects.filter(pk=export_id).update(
+            status="ready", file=name, rows_written=written, finished_at=now, expires_at=now + _ttl(),
+        )
+    except Exception as e:
+        logger.exception("Export %s failed", export_id)
+        if os.path.isfile(path):
+            os.remove(path)
+        now = timezone.now()
+        ExportJob.objects.filter(pk=export_id).update(
+            status="failed", error=str(e)[:200], finished_at=now, expires_at=now + _ttl(),
+        )
+
+
+def enqueue_export(user, scope, fmt, params):
+    """Create an ExportJob and hand it to the background worker once the row is committed."""
+    keys = EXPORT_PARAMS[scope]
+    export = ExportJob.objects.create(
+        user=user, scope=scope, format=fmt,
+        params={key: params[key] for key in keys if params.get(key)},
+    )
+    transaction.on_commit(lambda: submit(run_export, export.pk))
+    return export
+
+
+def export_payload(export):
+    """Status JSON for the polling endpoint."""
+    ready = export.status == "ready"
+    return {
+        "id": export.pk,
+        "status": export.status,
+        "format": export.format,
+        "rows_written": export.rows_written,
+        "rows_total": export.rows_total,
+        "progress": export.progress,
+        "error": export.error,
+        "status_url": reverse("export_status", args=[export.pk]),
+        "download_url": reverse("export_download", args=[export.pk]) if ready else None,
+        "expires_at": export.expires_at,
+    }
+
+
+def cleanup_exports(now=None):
+    """Delete expired exports and their files, plus jobs a dead worker left
+       pending/running for longer than the TTL. Returns how many were removed."""
+    now = now or timezone.now()
+    expired = list(ExportJob.objects.filter(
+        Q(expires_at__lt=now) | Q(expires_at__isnull=True, created_at__lt=now - _ttl())
+    ))
+    for export in expired:
+        export.delete_file()
+    ExportJob.objects.filter(pk__in=[e.pk for e in expired]).delete()
+    return len(expired)
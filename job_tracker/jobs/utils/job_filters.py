@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from jobs.utils.search import search_q
+
+STATUSES = ['applied', 'interview', 'rejected', 'offered']
+FILTER_PARAMS = ('status', 'q', 'date', 'follow')
+
+
+def non_string_filters(params):
+    """Filter names in a JSON params dict whose value isn't a string (or null).
+       filter_jobs expects what request.GET would hold."""
+    return [name for name in FILTER_PARAMS if params.get(name) is not None and not isinstance(params[name], str)]
+
+
+def filter_jobs(jobs, params, today):
+    """Apply the job_list filters (status, q, date, follow) to a Job queryset.
+       params is any mapping, e.g. request.GET or a JSON dict."""
+    status = params.get('status')
+    q = params.get('q')
+    date_range = params.get('date') # 'today' or 'week'
+    follow = params.get('follow')
+
+    if status in STATUSES:
+        jobs = jobs.filter(status=status)
+    if q:
+        jobs = jobs.filter(search_q(q))
+
+    if date_range == 'today':
+        jobs = jobs.filter(apply_date=today)
+    elif date_range == 'week':
+        start_week = today - timedelta(days=today.weekday())
+        end_week = start_week + timedelta(days=6)
+        jobs = jobs.filter(apply_date__range=[start_week, end_week])
+
+    if follow == 'today':
+        jobs = jobs.filter(follow_up_date=today,follow_up_done=False)
+    elif follow == 'overdue':
+        jobs = jobs.filter(follow_up_date__lt=today,follow_up_done=False)
+    elif follow == 'week':
+        end = today + timedelta(days=6)
+        jobs = jobs.filter(follow_up_date__range=(today, end),follow_up_done=False)
+    return jobs
@@ -0,0 +1,136 @@
+import csv
+from dataclasses import dataclass, field
+
+from django.db import transaction
+
+from jobs.forms import JobForm
+from jobs.models import Job, JobStats
+from jobs.utils.activity import log_activity
+from jobs.utils.exports import JOB_COLUMNS
+
+IMPORT_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 50
+
+# export header -> JobForm field, so a file from export_jobs_csv imports as-is ('ID' is ignored)
+HEADER_FIELDS = {header: name for header, name, _ in JOB_COLUMNS if name in JobForm.Meta.fields}
+
+# the export writes display labels for these, accept labels or codes
+LABEL_TO_CODE = {
+    'status': {label.lower(): code for code, label in Job.STATUS_CHOICES},
+    'priority': {label.lower(): code for code, label in Job.PRIORITY_CHOICES},
+    'source': {label.lower(): code for code, label in Job._meta.get_field('source').choices},
+}
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    created: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    errors: list = field(default_factory=list)  # [(line number, message)], capped
+
+    def add_error(self, line, message):
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+
+def normalize(value):
+    return " ".join(str(value or "").split()).casefold()
+
+
+def dedupe_key(company, title, apply_date):
+    return (normalize(company), normalize(title), apply_date)
+
+
+def _form_data(row):
+    data = {}
+    for header, value in row.items():
+        name = HEADER_FIELDS.get((header or "").strip())
+        if name is None:
+            continue
+        value = (value or "").strip()
+        if name in LABEL_TO_CODE:
+            value = LABEL_TO_CODE[name].get(value.lower(), value)
+        data[name] = value
+    return data
+
+
+def _insert_batch(user, batch, seen, result, dry_run):
+    """batch: unsaved, validated Jobs. Drops duplicates (already in the DB or earlier
+       in the file) and bulk inserts the rest."""
+    dates = {job.apply_date for job in batch}
+    existing = Job.objects.filter(user=user, apply_date__in=dates).values_list('company', 'title', 'apply_date')
+    known = {dedupe_key(*row) for row in existing.iterator()}
+
+    new_jobs = []
+    for job in batch:
+        key = dedupe_key(job.company, job.title, job.apply_date)
+        if key in known or key in seen:
+            result.duplicates += 1
+            continue
+        seen.add(key)
+        # bulk_create skips Job.save(), so do its work here
+        job.follow_up_done = False
+        job.refresh_tokens()
+        new_jobs.append(job)
+
+    if new_jobs and not dry_run:
+        with transaction.atomic():
+            Job.objects.bulk_create(new_jobs, batch_size=IMPORT_BATCH_SIZE)
+    result.created += len(new_jobs)
+
+
+def _import_rows(fh, user, batch_size, result, dry_run):
+    reader = csv.DictReader(fh)
+    if not reader.fieldnames or not {"Title", "Company", "Status", "Apply Date"} <= {h.strip() for h in reader.fieldnames}:
+        result.add_error(1, "Missing header row (expected the Export CSV columns).")
+        return
+
+    seen = set()
+    batch = []
+    for row in reader:
+        result.rows += 1
+        form = JobForm(data=_form_data(row))
+        if not form.is_valid():
+            message = "; ".join(f"{name}: {' '.join(errors)}" if name != '__all__' else ' '.join(errors)
+                                for name, errors in form.errors.items())
+            result.add_error(reader.line_num, message)
+            continue
+        job = form.save(commit=False)
+        job.user = user
+        batch.append(job)
+        if len(batch) == batch_size:
+            _insert_batch(user, batch, seen, result, dry_run)
+            batch = []
+    if batch:
+        _insert_batch(user, batch, seen, result, dry_run)
+
+
+def import_jobs(fh, user, batch_size=IMPORT_BATCH_SIZE, dry_run=False):
+    """Import jobs for user from a seekable text CSV stream in the export_jobs_csv layout.
+       Rows are validated with JobForm and inserted batch by batch, so memory stays
+       bounded by the batch size plus the dedupe keys of the file.
+       The whole file is read as a dry run first, so one that fails partway (e.g.
+       UnicodeDecodeError) inserts nothing. The real pass then commits per batch: one
+       transaction for the file would hold SQLite's write lock for the whole upload."""
+    result = ImportResult()
+    _import_rows(fh, user, batch_size, result, dry_run=True)
+    if dry_run or not result.created:
+        return result
+
+    fh.seek(0)
+    result = ImportResult()
+    try:
+        _import_rows(fh, user, batch_size, result, dry_run=False)
+    finally:
+        if result.created:
+            # bulk_create doesn't send post_save, rebuild the rollup once instead
+            # (also after a failed batch, for the ones already committed)
+            JobStats.rebuild(user)
+    if result.created:
+        log_activity(user, "jobs_imported", details={
+            "created": result.created, "duplicates": result.duplicates, "invalid": result.invalid,
+        })
+    return result
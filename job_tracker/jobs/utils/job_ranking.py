@@ -0,0 +1,52 @@
+import math
+from collections import Counter
+
+
+def match_job(resume_words: set, job) -> dict:
+    """Keyword overlap between a resume token set and one job's cached tokens."""
+    job_words = set(job.tokens)
+    common = resume_words.intersection(job_words)
+    missing = job_words - resume_words
+    return {
+        "job": job.title,
+        "match_percent": int((len(common) / max(len(job_words), 1)) * 100),
+        "matched_keywords": list(common)[:20],
+        "missing_keywords": list(missing)[:20],
+    }
+
+
+def rank_jobs(resume_words, jobs, top_n=20, missing_limit=10):
+    """Score every job against one resume in a single pass.
+
+       Each job is a sparse tf-idf vector (dict term -> weight) built from its
+       cached Job.tokens (binary tf), idf computed over the user's own jobs.
+       match_percent is the share of the job's tf-idf mass that the resume
+       covers, so rare, job-specific terms count more than words every
+       posting shares. Returns the top_n jobs, best first."""
+    resume_words = set(resume_words)
+    docs = [(job, set(job.tokens)) for job in jobs]
+    if not docs:
+        return []
+
+    df = Counter()
+    for _, terms in docs:
+        df.update(terms)
+    n_docs = len(docs)
+    idf = {term: math.log((1 + n_docs) / (1 + count)) + 1 for term, count in df.items()}
+
+    results = []
+    for job, terms in docs:
+        weights = {term: idf[term] for term in terms}
+        total = sum(weights.values())
+        matched = sum(w for term, w in weights.items() if term in resume_words)
+        missing = sorted((term for term in weights if term not in resume_words), key=lambda t: -weights[t])
+        results.append({
+            "job_id": job.id,
+            "job": job.title,
+            "company": job.company,
+            "match_percent": int(matched / total * 100) if total else 0,
+            "missing_keywords": missing[:missing_limit],
+        })
+
+    results.sort(key=lambda r: (-r["match_percent"], r["job_id"]))
+    return results[:top_n]
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.db.models import Count, Min, Q
+
+from jobs.utils.job_filters import STATUSES
+
+
+def job_counts(jobs, today):
+    """All dashboard counters for a Job queryset in one aggregate() query.
+       Keys match the template context names used by the views."""
+    start_week = today - timedelta(days=today.weekday())
+    end_week = start_week + timedelta(days=6)
+    open_follow_up = Q(follow_up_done=False)
+
+    counts = jobs.aggregate(
+        total_all=Count('id'),
+        **{f'total_{status}': Count('id', filter=Q(status=status)) for status in STATUSES},
+        follow_today=Count('id', filter=open_follow_up & Q(follow_up_date=today)),
+        follow_overdue=Count('id', filter=open_follow_up & Q(follow_up_date__lt=today)),
+        #in_progress(pipeline:not rejected, not offered)
+        in_progress=Count('id', filter=~Q(status__in=['rejected', 'offered'])),
+        applied_this_week=Count('id', filter=Q(status='applied', apply_date__range=[start_week, end_week])),
+        first_apply_date=Min('apply_date'),
+    )
+    return counts
@@ -0,0 +1,208 @@
+import atexit
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+EXTRACTION_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30)
+
+# name -> (type, help, buckets); everything reported on /metrics is declared here
+METRICS = {
+    "jobtracker_http_request_duration_seconds": ("histogram", "Request wall time by route name.", LATENCY_BUCKETS),
+    "jobtracker_http_request_queries": ("histogram", "DB queries per request by route name.", QUERY_BUCKETS),
+    "jobtracker_admin_activity_written_total": ("counter", "AdminActivity rows written.", None),
+    "jobtracker_login_failures_total": ("counter", "Failed login attempts.", None),
+    "jobtracker_login_rate_limited_total": ("counter", "Login requests blocked by the rate limiter.", None),
+    "jobtracker_resume_extraction_duration_seconds": ("histogram", "PDF text extraction time by result.", EXTRACTION_BUCKETS),
+    "jobtracker_export_rows_total": ("counter", "Rows written by exports, by kind.", None),
+}
+
+DEFAULT_SETTINGS = {
+    "DIR": None,            # shared directory for multi-process aggregation; None = this process only
+    "WRITE_INTERVAL": 5,    # seconds between per-process snapshots
+    "ALLOWED_IPS": [],      # client ips (rate_limit.get_client_ip) that may scrape without a staff login
+}
+
+_lock = threading.Lock()
+_counters = {}    # (name, labels) -> value
+_histograms = {}  # (name, labels) -> [bucket counts..., +Inf count, sum]
+_last_write = 0.0
+_identity = None  # (pid, start time in ms) of the process owning the snapshot file
+
+
+def metrics_settings():
+    return {**DEFAULT_SETTINGS, **getattr(settings, "METRICS", {})}
+
+
+def _key(name, labels):
+    return name, tuple(sorted((labels or {}).items()))
+
+
+def inc(name, amount=1, labels=None):
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+    _maybe_write()
+
+
+def observe(name, value, labels=None):
+    buckets = METRICS[name][2]
+    key = _key(name, labels)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+        # non-cumulative per bucket, cumulated when rendering
+        hist[bisect.bisect_left(buckets, value)] += 1
+        hist[-1] += value
+    _maybe_write()
+
+
+def _snapshot():
+    with _lock:
+        return {
+            "counters": [[name, list(labels), value] for (name, labels), value in _counters.items()],
+            "histograms": [[name, list(labels), list(hist)] for (name, labels), hist in _histograms.items()],
+        }
+
+
+def _path(directory):
+    # pid plus start time, so a recycled pid doesn't overwrite a dead process's file
+    global _identity
+    pid = os.getpid()
+    if _identity is None or _identity[0] != pid:  # first write, or forked since
+        _identity = (pid, time.time_ns() // 1_000_000)
+    return os.path.join(directory, f"metrics_{pid}_{_identity[1]}.json")
+
+
+def _alive(pid):
+    if os.name != "posix":
+        return True  # no side-effect-free check here; files are kept until DIR is emptied
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def write_snapshot():
+    """Dump this process's metrics into METRICS['DIR'] (atomic replace)."""
+    global _last_write
+    directory = metrics_settings()["DIR"]
+    if not directory:
+        return
+    _last_write = time.monotonic()
+    os.makedirs(directory, exist_ok=True)
+    tmp = _path(directory) + ".tmp"
+    with open(tmp, "w") as fh:
+        json.dump(_snapshot(), fh)
+    os.replace(tmp, _path(directory))
+
+
+def _maybe_write():
+    conf = metrics_settings()
+    if conf["DIR"] and time.monotonic() - _last_write >= conf["WRITE_INTERVAL"]:
+        try:
+            write_snapshot()
+        except OSError:
+            logger.exception("Could not write metrics snapshot")
+
+
+def _collect():
+    """Snapshots of every process on this host. Files of exited processes (recycled
+       workers, management commands) are deleted, so their counts drop out of the sums
+       and Prometheus sees a counter reset, which rate() and increase() handle."""
+    directory = metrics_settings()["DIR"]
+    if not directory:
+        return [_snapshot()]
+    write_snapshot()
+    snapshots = []
+    for name in os.listdir(directory):
+        if name.startswith("metrics_") and name.endswith(".json"):
+            path = os.path.join(directory, name)
+            pid = name[len("metrics_"):-len(".json")].split("_")[0]
+            if pid.isdigit() and int(pid) != os.getpid() and not _alive(int(pid)):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            try:
+                with open(path) as fh:
+                    snapshots.append(json.load(fh))
+            except (OSError, ValueError):
+                continue  # being replaced right now, next scrape gets it
+    return snapshots
+
+
+def _labels(pairs, extra=()):
+    pairs = [*pairs, *extra]
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render():
+    """Prometheus text exposition format (version 0.0.4)."""
+    counters, histograms = {}, {}
+    for snapshot in _collect():
+        for name, labels, value in snapshot["counters"]:
+            key = (name, tuple(map(tuple, labels)))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, hist in snapshot["histograms"]:
+            key = (name, tuple(map(tuple, labels)))
+            total = histograms.setdefault(key, [0] * len(hist))
+            for i, value in enumerate(hist):
+                total[i] += value
+
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == "counter":
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+            continue
+        for (metric, labels), hist in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip((*buckets, "+Inf"), hist[:-1]):
+                cumulative += count
+                le = bound if bound == "+Inf" else _number(float(bound))
+                lines.append(f"{name}_bucket{_labels(labels, [('le', le)])} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(float(hist[-1]))}")
+            lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+@atexit.register
+def _write_at_exit():
+    if not _counters and not _histograms:
+        return  # management commands that never served a request
+    try:
+        write_snapshot()
+    except OSError:
+        pass
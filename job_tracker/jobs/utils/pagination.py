@@ -0,0 +1,146 @@
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # keep microseconds, DjangoJSONEncoder trims them and the seek would skip rows
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(data: dict) -> str:
+    raw = json.dumps(data, cls=CursorEncoder, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str):
+    """Opaque token -> dict, or None if it is missing/garbled."""
+    if not token:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (ValueError, binascii.Error):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("k"), list):
+        return None
+    return data
+
+
+def _key_field(queryset, field):
+    annotation = queryset.query.annotations.get(field)
+    if annotation is not None:
+        return annotation.output_field
+    return queryset.model._meta.get_field(field)
+
+
+def _clean_cursor(queryset, keys, cursor):
+    """The decoded cursor with its key values converted by their model fields, or None
+       if anything in it is off. The token comes from the URL, so treat it as user input."""
+    if cursor is None or len(cursor["k"]) != len(keys):
+        return None
+    offset = cursor.get("o", 0)
+    if not isinstance(offset, int) or isinstance(offset, bool) or cursor.get("d", "n") not in ("n", "p"):
+        return None
+    values = []
+    for (field, _), value in zip(keys, cursor["k"]):
+        if value is None or isinstance(value, (dict, list)):
+            return None
+        try:
+            value = _key_field(queryset, field).to_python(value)
+        except (FieldDoesNotExist, ValidationError, TypeError, ValueError):
+            return None
+        if value is None:
+            return None
+        values.append(value)
+    return {**cursor, "k": values}
+
+
+def _seek(keys, values, forward):
+    """Rows strictly after (forward) / before the given key, in sort order.
+       keys: [(field, descending)]; the last key must be unique (id)."""
+    clauses = Q()
+    equal = Q()
+    for (field, descending), value in zip(keys, values):
+        op = "lt" if descending == forward else "gt"
+        clauses |= equal & Q(**{f"{field}__{op}": value})
+        equal &= Q(**{field: value})
+    # bound on the leading column so the index range scan starts at the cursor
+    field, descending = keys[0]
+    lead = Q(**{f"{field}__{'lte' if descending == forward else 'gte'}": values[0]})
+    return lead & clauses
+
+
+class KeysetPage:
+    """Quacks enough like django.core.paginator.Page for the list templates."""
+    is_keyset = True
+
+    def __init__(self, object_list, offset, has_next, has_previous, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.offset = offset
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def start_index(self):
+        return self.offset + 1 if self.object_list else 0
+
+    def end_index(self):
+        return self.offset + len(self.object_list)
+
+
+def keyset_paginate(queryset, keys, cursor_token, per_page):
+    """Cursor pagination: every page is one indexed range query of per_page + 1
+       rows, no COUNT(*) and no OFFSET. keys: [(field, descending)] ending in a
+       unique column; fields may be annotations on the queryset."""
+    cursor = _clean_cursor(queryset, keys, decode_cursor(cursor_token))
+    forward = cursor is None or cursor.get("d") != "p"
+
+    ordering = [("-" if descending == forward else "") + field for field, descending in keys]
+    queryset = queryset.order_by(*ordering)
+    if cursor is not None:
+        queryset = queryset.filter(_seek(keys, cursor["k"], forward))
+
+    rows = list(queryset[:per_page + 1])
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if not forward:
+        rows.reverse()
+
+    offset = max(cursor.get("o", 0), 0) if cursor else 0
+    if forward:
+        has_next, has_previous = has_more, cursor is not None
+    else:
+        has_next, has_previous = True, has_more
+        if not has_previous:
+            offset = 0
+
+    def key_of(row):
+        # model instances or values() dicts
+        if isinstance(row, dict):
+            return [row[field] for field, _ in keys]
+        return [getattr(row, field) for field, _ in keys]
+
+    next_cursor = encode_cursor({"k": key_of(rows[-1]), "d": "n", "o": offset + len(rows)}) if rows and has_next else None
+    previous_cursor = encode_cursor({"k": key_of(rows[0]), "d": "p", "o": max(offset - per_page, 0)}) if rows and has_previous else None
+    return KeysetPage(rows, offset, has_next, has_previous, next_cursor, previous_cursor)
@@ -0,0 +1,137 @@
+import contextvars
+import threading
+import time
+from collections import defaultdict, deque
+
+from django.conf import settings
+
+DEFAULT_SETTINGS = {
+    "SAMPLE_SIZE": 500,      # requests kept per url name for the percentiles
+    "SERVER_TIMING": "staff",  # "staff" = header only for staff users (and DEBUG), True = everyone, False = never
+}
+
+# timings of the request being handled in this thread/task, None outside a request
+_current = contextvars.ContextVar("request_timings", default=None)
+
+_lock = threading.Lock()
+_samples = defaultdict(deque)
+
+
+def perf_settings():
+    return {**DEFAULT_SETTINGS, **getattr(settings, "PERFORMANCE", {})}
+
+
+class RequestTimings:
+    __slots__ = ("queries", "db", "template", "pdf")
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.template = 0.0
+        self.pdf = 0.0
+
+
+def start_request():
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def add(name, seconds):
+    """Add time spent in a component (template, pdf) to the current request, if any."""
+    timings = _current.get()
+    if timings is not None:
+        setattr(timings, name, getattr(timings, name) + seconds)
+
+
+def db_wrapper(execute, sql, params, many, context):
+    # connection.execute_wrapper hook: count queries and their time
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings = _current.get()
+        if timings is not None:
+            timings.queries += 1
+            timings.db += time.perf_counter() - started
+
+
+def instrument_templates():
+    """Time top-level template renders. Includes/extends render inside these,
+       so nothing is counted twice. Called once from JobsConfig.ready()."""
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, "_perf_wrapped", False):
+        return
+    original = Template.render
+
+    def render(self, context=None, request=None):
+        started = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            add("template", time.perf_counter() - started)
+
+    render._perf_wrapped = True
+    Template.render = render
+
+
+def record(route, total, timings):
+    sample = (total, timings.queries, timings.db, timings.template, timings.pdf)
+    size = perf_settings()["SAMPLE_SIZE"]
+    with _lock:
+        samples = _samples[route]
+        if samples.maxlen != size:
+            samples = _samples[route] = deque(samples, maxlen=size)
+        samples.append(sample)
+
+
+def server_timing(total, timings):
+    parts = [
+        f"total;dur={total * 1000:.1f}",
+        f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} queries"',
+        f"tpl;dur={timings.template * 1000:.1f}",
+    ]
+    if timings.pdf:
+        parts.append(f"pdf;dur={timings.pdf * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summary():
+    """Rolling stats per url name for this process, slowest p95 first. Times in ms."""
+    with _lock:
+        snapshot = {route: list(samples) for route, samples in _samples.items()}
+    rows = []
+    for route, samples in snapshot.items():
+        totals = sorted(s[0] for s in samples)
+        queries = sorted(s[1] for s in samples)
+        db = sorted(s[2] for s in samples)
+        rows.append({
+            "route": route,
+            "count": len(samples),
+            "p50": percentile(totals, 50) * 1000,
+            "p95": percentile(totals, 95) * 1000,
+            "p99": percentile(totals, 99) * 1000,
+            "queries_p50": percentile(queries, 50),
+            "queries_max": queries[-1],
+            "db_p95": percentile(db, 95) * 1000,
+            "template_avg": sum(s[3] for s in samples) / len(samples) * 1000,
+            "pdf_total": sum(s[4] for s in samples) * 1000,
+        })
+    rows.sort(key=lambda r: r["p95"], reverse=True)
+    return rows
+
+
+def reset():
+    with _lock:
+        _samples.clear()
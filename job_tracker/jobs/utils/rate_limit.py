@@ -0,0 +1,78 @@
+import ipaddress
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+DEFAULT_LIMITS = {
+    "MAX_ATTEMPTS": 5,   # failed logins per client ip ...
+    "WINDOW": 180,       # ... within this many seconds
+    "CACHE": "ratelimit",  # needs atomic incr() shared by all workers (redis/memcached) in production
+    # X-Forwarded-For is client supplied; it is only read behind proxies listed here,
+    # either a hop count (int) or a list of proxy addresses/networks. 0 = use REMOTE_ADDR
+    "TRUSTED_PROXIES": 0,
+}
+
+
+def _limits():
+    return {**DEFAULT_LIMITS, **getattr(settings, "LOGIN_RATE_LIMIT", {})}
+
+
+def _is_trusted(address, networks):
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+
+def get_client_ip(request):
+    """REMOTE_ADDR, or with TRUSTED_PROXIES set the right-most X-Forwarded-For hop that
+       wasn't added by one of our proxies. Entries left of that are whatever the client sent."""
+    remote = request.META.get("REMOTE_ADDR")
+    trusted = _limits()["TRUSTED_PROXIES"]
+    if not trusted:
+        return remote
+    xff = request.META.get("HTTP_X_FORWARDED_FOR", "")
+    hops = [hop.strip() for hop in xff.split(",") if hop.strip()] + [remote]
+    if isinstance(trusted, int):
+        # each of the `trusted` proxies appended one hop, REMOTE_ADDR being the last of them
+        return hops[max(len(hops) - 1 - trusted, 0)]
+    networks = [ipaddress.ip_network(net, strict=False) for net in trusted]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, networks):
+            return hop
+    return hops[0]
+
+
+def _keys(ip, window, now):
+    bucket = int(now // window)
+    return f"login-fail:{ip}:{bucket}", f"login-fail:{ip}:{bucket - 1}", now % window / window
+
+
+def record_failure(ip, now=None):
+    """Count one failed login for ip. Each ip has one counter per window, every
+       counter expires after two windows, so the store never grows past the active ips.
+       incr() is only atomic on redis/memcached; the file and locmem caches can lose
+       counts when workers fail at the same moment."""
+    limits = _limits()
+    cache = caches[limits["CACHE"]]
+    current, _, _ = _keys(ip, limits["WINDOW"], now or time.time())
+    cache.add(current, 0, timeout=2 * limits["WINDOW"])
+    try:
+        cache.incr(current)
+    except ValueError:  # expired between add() and incr()
+        cache.set(current, 1, timeout=2 * limits["WINDOW"])
+
+
+def failed_attempts(ip, now=None):
+    """Sliding-window estimate: this window's count plus the previous window's,
+       weighted by how much of it still overlaps the last WINDOW seconds."""
+    limits = _limits()
+    current, previous, elapsed = _keys(ip, limits["WINDOW"], now or time.time())
+    counts = caches[limits["CACHE"]].get_many([current, previous])
+    return counts.get(current, 0) + counts.get(previous, 0) * (1 - elapsed)
+
+
+def is_limited(ip, now=None):
+    return failed_attempts(ip, now) >= _limits()["MAX_ATTEMPTS"]
@@ -0,0 +1,42 @@
+import hashlib
+
+from jobs.models import ResumeText, UserProfile
+from jobs.utils.tokenizer import keyword_set
+from jobs.utils.resume_parser import ResumeExtractionError, extract_pdf
+
+CHUNK_SIZE = 64 * 1024
+
+
+def file_sha256(path: str) -> str:
+    """Hash a file in chunks so big uploads don't land in memory at once."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_resume_text(profile: UserProfile):
+    """Return the cached ResumeText for the profile's current resume.
+       Parses the PDF only the first time a given file content is seen;
+       raises ResumeExtractionError if the file can't be parsed (failures aren't cached)."""
+    if not profile or not profile.resume:
+        return None
+
+    if not profile.resume_hash:
+        profile.resume_hash = file_sha256(profile.resume.path)
+        # plain update so we don't touch updated_at or the old-file cleanup in save();
+        # the resume filter skips it if a newer file was uploaded meanwhile
+        UserProfile.objects.filter(pk=profile.pk, resume=profile.resume.name).update(resume_hash=profile.resume_hash)
+
+    cached = ResumeText.objects.filter(sha256=profile.resume_hash).first()
+    if cached:
+        return cached
+
+    result = extract_pdf(profile.resume.path)
+    if not result.ok:
+        raise ResumeExtractionError(result.error)
+    text = result.text
+    tokens = keyword_set(text)
+    cached, _ = ResumeText.objects.get_or_create(sha256=profile.resume_hash, defaults={"text": text, "tokens": tokens})
+    return cached
@@ -1,12 +1,189 @@
-from pdfminer.high_level import extract_text
+import io
+import logging
+import math
+import multiprocessing
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from jobs.utils import metrics, perf
+
+try:
+    import resource
+except ImportError:  # not available on Windows, limits are skipped there
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# failure reasons reported back to callers
+MISSING_FILE = "missing_file"
+TIMEOUT = "timeout"
+MEMORY_LIMIT = "memory_limit"
+ENCRYPTED = "encrypted"
+INVALID_PDF = "invalid_pdf"
+NO_TEXT = "no_text"
+CRASHED = "crashed"
+
+DEFAULT_LIMITS = {
+    "TIMEOUT": 20,       # wall clock seconds
+    "MAX_PAGES": 10,     # pages beyond this are ignored
+    "MEMORY_MB": 512,    # address space cap for the child process
+}
+
+
+class ResumeExtractionError(Exception):
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass
+class ExtractionResult:
+    text: str = ""
+    pages: int = 0
+    truncated: bool = False
+    duration: float = 0.0
+    error: str = ""
+
+    @property
+    def ok(self):
+        return not self.error
+
+
+_stats_lock = threading.Lock()
+_stats = {"runs": 0, "failures": {}, "seconds_total": 0.0, "seconds_max": 0.0, "pages_total": 0}
+
+
+def _record(result: ExtractionResult):
+    with _stats_lock:
+        _stats["runs"] += 1
+        _stats["seconds_total"] += result.duration
+        _stats["seconds_max"] = max(_stats["seconds_max"], result.duration)
+        _stats["pages_total"] += result.pages
+        if result.error:
+            _stats["failures"][result.error] = _stats["failures"].get(result.error, 0) + 1
+    perf.add("pdf", result.duration)
+    metrics.observe("jobtracker_resume_extraction_duration_seconds", result.duration, {"result": result.error or "ok"})
+    logger.info("pdf extraction: pages=%s duration=%.3fs error=%s", result.pages, result.duration, result.error or "-")
+
+
+def extraction_stats() -> dict:
+    """Counters for extractions done by this process."""
+    with _stats_lock:
+        return {**_stats, "failures": dict(_stats["failures"])}
+
+
+def _limits():
+    return {**DEFAULT_LIMITS, **getattr(settings, "RESUME_EXTRACTION", {})}
+
+
+def extraction_timeout():
+    """Wall clock seconds one extraction may take before the child is killed."""
+    return _limits()["TIMEOUT"]
+
+
+def _send(conn, payload):
+    try:
+        conn.send(payload)
+    except (BrokenPipeError, EOFError):  # parent already gave up on us
+        pass
+
+
+def _extract_in_child(file_path, max_pages, memory_mb, cpu_seconds, conn):
+    """Child process entry point: import pdfminer, apply rlimits, parse, send a dict back."""
+    # before the limits: the imports alone can exceed a low MEMORY_MB, and that would
+    # show up as a crash instead of memory_limit
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfdocument import PDFEncryptionError, PDFPasswordIncorrect
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    if resource is not None:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+
+    try:
+        out = io.StringIO()
+        rsrcmgr = PDFResourceManager()
+        device = TextConverter(rsrcmgr, out, laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        pages = 0
+        truncated = False
+        with open(file_path, "rb") as fh:
+            # ask for one extra page just to know whether we cut the document short
+            for page in PDFPage.get_pages(fh, maxpages=max_pages + 1):
+                if pages == max_pages:
+                    truncated = True
+                    break
+                interpreter.process_page(page)
+                pages += 1
+        device.close()
+        _send(conn, {"text": out.getvalue().strip(), "pages": pages, "truncated": truncated})
+    except MemoryError:
+        _send(conn, {"error": MEMORY_LIMIT})
+    except (PDFEncryptionError, PDFPasswordIncorrect):
+        _send(conn, {"error": ENCRYPTED})
+    except Exception:
+        _send(conn, {"error": INVALID_PDF})
+    finally:
+        conn.close()
+
+
+def extract_pdf(file_path: str) -> ExtractionResult:
+    """Extract text from a PDF in a separate, resource-limited process.
+       Never raises; failures come back in ExtractionResult.error."""
+    started = time.monotonic()
+    if not os.path.isfile(file_path):
+        result = ExtractionResult(error=MISSING_FILE)
+        _record(result)
+        return result
+
+    limits = _limits()
+    ctx = multiprocessing.get_context("forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(
+        target=_extract_in_child,
+        args=(file_path, limits["MAX_PAGES"], limits["MEMORY_MB"], math.ceil(limits["TIMEOUT"]) + 1, send_conn),
+        daemon=True,
+    )
+    proc.start()
+    send_conn.close()
+
+    payload = None
+    timed_out = not recv_conn.poll(limits["TIMEOUT"])
+    if not timed_out:
+        try:
+            payload = recv_conn.recv()
+        except EOFError:  # child died without answering
+            payload = None
+    recv_conn.close()
+
+    proc.join(1)
+    if proc.is_alive():
+        proc.kill()
+        proc.join()
+
+    if payload is None:
+        # SIGXCPU means the cpu rlimit fired, treat it like the wall clock timeout
+        error = TIMEOUT if timed_out or proc.exitcode == -24 else CRASHED
+        result = ExtractionResult(error=error)
+    elif "error" in payload:
+        result = ExtractionResult(error=payload["error"])
+    else:
+        result = ExtractionResult(text=payload["text"], pages=payload["pages"], truncated=payload["truncated"])
+        if not result.text:
+            result.error = NO_TEXT
+    result.duration = time.monotonic() - started
+    _record(result)
+    return result
+
 
 def extract_text_from_pdf(file_path: str) -> str:
     """Extract text from a PDF resume.
-       Returns plain text string."""
-    try:
-        text = extract_text(file_path)
-        if not text:
-            return ""
-        return text.strip()
-    except Exception as e:
-        return ""
\ No newline at end of file
+       Returns plain text string ("" when extraction failed)."""
+    return extract_pdf(file_path).text
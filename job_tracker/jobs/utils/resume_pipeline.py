@@ -0,0 +1,68 @@
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from jobs.models import ResumeText, UserProfile
+from jobs.utils.background import submit
+from jobs.utils.resume_cache import get_resume_text
+from jobs.utils.resume_parser import CRASHED, ResumeExtractionError, extraction_timeout
+from jobs.utils.section_detector import analyze_sections
+
+logger = logging.getLogger(__name__)
+
+# on top of the extraction timeout: queue wait plus section analysis
+CLAIM_MARGIN = timedelta(minutes=2)
+
+def process_resume(profile_id):
+    """Extract, analyze and persist the profile's current resume.
+       Runs in a background worker, never in the request."""
+    profile = UserProfile.objects.filter(pk=profile_id).first()
+    if not profile or not profile.resume:
+        return
+    resume_name = profile.resume.name
+    # restart the clock: time spent waiting in the queue doesn't count against the claim
+    UserProfile.objects.filter(pk=profile_id, resume_status="processing").update(resume_claimed_at=timezone.now())
+    error = ""
+    try:
+        resume = get_resume_text(profile)
+        if resume.score is None:
+            ResumeText.objects.filter(pk=resume.pk).update(**analyze_sections(resume.text))
+        status = "ready"
+    except ResumeExtractionError as e:
+        logger.warning("Resume extraction failed for profile %s: %s", profile_id, e.reason)
+        status, error = "failed", e.reason
+    except Exception:
+        logger.exception("Resume processing failed for profile %s", profile_id)
+        status, error = "failed", CRASHED
+    # only mark the file we actually processed, a newer upload stays pending
+    UserProfile.objects.filter(pk=profile_id, resume=resume_name).update(resume_status=status, resume_error=error)
+
+
+def _stale_claim_cutoff():
+    return timezone.now() - timedelta(seconds=extraction_timeout()) - CLAIM_MARGIN
+
+
+def claim_expired(profile):
+    """True if the profile has been 'processing' for longer than any extraction can take,
+       i.e. the worker that claimed it was restarted or killed before finishing."""
+    return profile.resume_status == "processing" and (
+        profile.resume_claimed_at is None or profile.resume_claimed_at < _stale_claim_cutoff()
+    )
+
+
+def enqueue_resume(profile_id):
+    """Queue processing for a pending resume, or one whose claim expired (see claim_expired).
+       The conditional update acts as a claim, so concurrent requests/workers never process
+       the same upload twice."""
+    expired = Q(resume_status="processing") & (
+        Q(resume_claimed_at__isnull=True) | Q(resume_claimed_at__lt=_stale_claim_cutoff())
+    )
+    claimed = UserProfile.objects.filter(Q(resume_status="pending") | expired, pk=profile_id).update(
+        resume_status="processing", resume_claimed_at=timezone.now(),
+    )
+    if claimed:
+        transaction.on_commit(lambda: submit(process_resume, profile_id))
+    return bool(claimed)
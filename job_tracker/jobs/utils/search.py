@@ -0,0 +1,106 @@
+import logging
+import re
+import sqlite3
+
+from django.db import OperationalError, connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "jobs_job_fts"
+FTS_COLUMNS = ("title", "company", "notes", "next_step", "contact_name", "contact_email", "contact_phone")
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+_cols = ", ".join(FTS_COLUMNS)
+_new = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+_old = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+# external-content FTS5 index over jobs_job, kept in sync by triggers so every
+# write path (save, queryset.update, bulk_create, raw SQL) updates it
+FTS_SCHEMA = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {_cols}, content='jobs_job', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3')""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON jobs_job BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_cols}) VALUES (new.id, {_new});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON jobs_job BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_cols}) VALUES ('delete', old.id, {_old});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {_cols} ON jobs_job BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_cols}) VALUES ('delete', old.id, {_old});
+        INSERT INTO {FTS_TABLE}(rowid, {_cols}) VALUES (new.id, {_new});
+    END""",
+]
+
+_available = None
+
+
+def install_fts(using_connection=None):
+    """Create the FTS table/triggers if missing and rebuild the index when
+       anything had to be (re)created. Safe to call on every migrate: SQLite
+       drops triggers when a migration remakes jobs_job."""
+    global _available
+    conn = using_connection or connection
+    if conn.vendor != "sqlite":
+        _available = False
+        return False
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM sqlite_master WHERE name LIKE %s", [f"{FTS_TABLE}%"])
+        before = cursor.fetchone()[0]
+        try:
+            for statement in FTS_SCHEMA:
+                cursor.execute(statement)
+        except OperationalError:
+            # sqlite built without fts5
+            logger.warning("SQLite FTS5 not available, job search falls back to icontains")
+            _available = False
+            return False
+        cursor.execute("SELECT count(*) FROM sqlite_master WHERE name LIKE %s", [f"{FTS_TABLE}%"])
+        if cursor.fetchone()[0] != before:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    _available = True
+    return True
+
+
+def fts_available():
+    global _available
+    if _available is None:
+        if connection.vendor != "sqlite":
+            _available = False
+        else:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+                _available = cursor.fetchone() is not None
+    return _available
+
+
+def match_expression(q):
+    """User input -> FTS5 query: every term must match, each as a prefix."""
+    terms = TERM_RE.findall(q.lower())
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+def search_q(q):
+    """Q object restricting Jobs to those matching the search text."""
+    match = match_expression(q) if fts_available() else ""
+    if not match:
+        return Q(title__icontains=q) | Q(company__icontains=q)
+    return Q(id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]))
+
+
+def rank_expression(q):
+    """bm25 relevance for ordering (lower is better, NULL for rows the text didn't match),
+       or None without FTS. The MATCH runs once in a materialized CTE that each row then
+       looks up by rowid; probing the FTS table per row re-runs the full-text query every time."""
+    match = match_expression(q) if fts_available() else ""
+    if not match:
+        return None
+    # MATERIALIZED needs sqlite 3.35; older versions materialize the CTE on their own judgement
+    materialized = "MATERIALIZED " if sqlite3.sqlite_version_info >= (3, 35) else ""
+    return RawSQL(
+        f"WITH matches AS {materialized}(SELECT rowid, bm25({FTS_TABLE}) AS score FROM {FTS_TABLE} "
+        f"WHERE {FTS_TABLE} MATCH %s) SELECT score FROM matches WHERE rowid = jobs_job.id",
+        [match],
+    )
@@ -0,0 +1,98 @@
+import re
+from functools import lru_cache
+
+from django.conf import settings
+
+# section -> heading aliases; core sections are the ones the score is built from
+SECTION_TAXONOMY = {
+    "Summary": ["summary", "profile", "professional summary", "career summary", "objective", "career objective",
+                "about me", "personal statement", "executive summary", "professional profile"],
+    "Experience": ["experience", "work experience", "professional experience", "employment history",
+                   "work history", "career history", "employment", "internships", "internship"],
+    "Education": ["education", "academic background", "educational background", "qualifications",
+                  "academic qualifications", "academics"],
+    "Skills": ["skills", "technical skills", "key skills", "core competencies", "competencies",
+               "technologies", "tech stack", "areas of expertise", "expertise", "skill set"],
+    "Projects": ["projects", "project", "personal projects", "academic projects", "key projects", "portfolio"],
+    "Certifications": ["certifications", "certification", "certificates", "licenses", "licenses and certifications",
+                       "courses", "training", "professional development"],
+    "Achievements": ["achievements", "awards", "honors", "honours", "accomplishments", "awards and honors"],
+    "Publications": ["publications", "research", "research experience", "papers", "patents"],
+    "Languages": ["languages", "language proficiency"],
+    "Volunteering": ["volunteer", "volunteering", "volunteer experience", "community service"],
+    "Leadership": ["leadership", "positions of responsibility", "extracurricular activities", "activities"],
+    "Interests": ["interests", "hobbies", "hobbies and interests"],
+    "References": ["references", "referees"],
+}
+CORE_SECTIONS = ["Education", "Experience", "Projects", "Skills", "Summary"]
+
+HEADING_WEIGHT = 1.0  # alias starts a short line, e.g. "WORK EXPERIENCE:"
+BODY_WEIGHT = 0.3     # alias mentioned inside running text
+FOUND_THRESHOLD = 0.5
+HEADING_MAX_EXTRA = 12  # chars allowed on a heading line besides the alias (colons, dates, bullets)
+LINE_PREFIX = " \t•·-*#>|"
+
+
+def get_taxonomy():
+    """Built-in taxonomy merged with settings.RESUME_SECTION_TAXONOMY (same shape)."""
+    return {**SECTION_TAXONOMY, **getattr(settings, "RESUME_SECTION_TAXONOMY", {})}
+
+
+@lru_cache(maxsize=8)
+def _compile(taxonomy_items):
+    alias_to_section = {}
+    for section, aliases in taxonomy_items:
+        for alias in aliases:
+            alias_to_section[alias.lower()] = section
+    # longest alias first so "work experience" wins over "experience" at the same spot
+    alternation = "|".join(re.escape(a) for a in sorted(alias_to_section, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b"), alias_to_section
+
+
+def detect_sections(text: str, taxonomy=None) -> dict:
+    """One regex pass over the lowercased text.
+       Returns {section: {"positions": [...], "confidence": 0..1, "heading": bool}}
+       for every section with at least one hit."""
+    taxonomy = taxonomy or get_taxonomy()
+    pattern, alias_to_section = _compile(tuple((s, tuple(a)) for s, a in taxonomy.items()))
+    lowered = (text or "").lower()
+
+    found = {}
+    for m in pattern.finditer(lowered):
+        section = alias_to_section[m.group(0)]
+        line_start = lowered.rfind("\n", 0, m.start()) + 1
+        line_end = lowered.find("\n", m.end())
+        if line_end == -1:
+            line_end = len(lowered)
+        rest = lowered[m.end():line_end].lstrip()
+        is_heading = (
+            not lowered[line_start:m.start()].strip(LINE_PREFIX)
+            # short line on its own, or an inline "Skills: python, sql" style heading
+            and ((line_end - line_start) - len(m.group(0)) <= HEADING_MAX_EXTRA or rest.startswith((":", "-", "|")))
+        )
+        entry = found.setdefault(section, {"positions": [], "score": 0.0, "heading": False})
+        entry["positions"].append(m.start())
+        entry["score"] += HEADING_WEIGHT if is_heading else BODY_WEIGHT
+        entry["heading"] = entry["heading"] or is_heading
+
+    return {
+        section: {"positions": e["positions"], "confidence": round(min(e["score"], 1.0), 2), "heading": e["heading"]}
+        for section, e in found.items()
+    }
+
+
+def analyze_sections(text: str) -> dict:
+    """Section check + score for the resume checker.
+       Returns the fields stored on ResumeText."""
+    details = detect_sections(text)
+    found = {s for s, d in details.items() if d["confidence"] >= FOUND_THRESHOLD}
+    sections_found = [s for s in CORE_SECTIONS if s in found]
+    missing_sections = [s for s in CORE_SECTIONS if s not in found]
+    # 5 core sections → each = 20 points
+    score = min(len(sections_found) * 20, 100)
+    return {
+        "score": score,
+        "sections_found": sections_found + sorted(found - set(CORE_SECTIONS)),
+        "missing_sections": missing_sections,
+        "section_details": details,
+    }
@@ -0,0 +1,304 @@
+import hashlib
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+from jobs.models import AdminActivity, Job, JobStats, ResumeText, UserProfile
+from jobs.utils.section_detector import analyze_sections
+from jobs.utils.tokenizer import keyword_set
+
+SEED_BATCH_SIZE = 5000
+SEED_PASSWORD = "seed-password"
+USERNAME_PREFIX = "seed_user_"
+KEEP_JOB_IDS = 50  # job ids remembered per user for activity rows, keeps memory flat for millions of jobs
+
+TITLES = [
+    "Software Engineer", "Backend Engineer", "Frontend Developer", "Full Stack Developer", "Data Analyst",
+    "Data Scientist", "Machine Learning Engineer", "DevOps Engineer", "Site Reliability Engineer",
+    "Product Manager", "QA Engineer", "Mobile Developer", "Cloud Architect", "Security Analyst",
+    "Business Analyst", "Python Developer", "Java Developer", "Platform Engineer",
+]
+LEVELS = ["", "Junior ", "Senior ", "Lead ", "Staff "]
+COMPANIES = [
+    "Acme Corp", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises", "Hooli",
+    "Pied Piper", "Cyberdyne", "Soylent", "Wonka Labs", "Tyrell", "Massive Dynamic", "Aperture Science",
+    "Vandelay Industries", "Oscorp", "Dunder Mifflin", "Gringotts", "Monsters Inc", "Blue Sun",
+]
+NOTES = [
+    "python django postgresql rest api", "react typescript graphql", "aws kubernetes docker terraform",
+    "machine learning pandas sql", "java spring boot microservices", "referral from former colleague",
+    "remote friendly, good benefits", "", "", "",
+]
+NEXT_STEPS = ["", "", "Send thank-you note", "Prepare system design", "Follow up with recruiter", "Take-home task"]
+# weights roughly follow a real funnel
+STATUSES = [("applied", 60), ("interview", 20), ("rejected", 15), ("offered", 5)]
+PRIORITIES = [("medium", 50), ("high", 25), ("low", 25)]
+SOURCES = [("linkedin", 40), ("company", 20), ("referral", 15), ("naukri", 10), ("other", 5), ("", 10)]
+ACTIONS = [("login", 50), ("job_created", 25), ("job_updated", 15), ("followup_done", 7),
+           ("resume_uploaded", 2), ("resume_updated", 1)]
+
+RESUME_NAMES = ["Jane Doe", "Arjun Mehta", "Maria Garcia", "Chen Wei", "Sam Taylor", "Priya Nair", "Tom Becker"]
+RESUME_SKILLS = [
+    "python, django, sql, rest api, docker, aws",
+    "react, typescript, graphql, css, jest",
+    "java, spring boot, microservices, kafka, kubernetes",
+    "machine learning, pandas, sql, tensorflow, statistics",
+    "terraform, kubernetes, ci/cd, linux, monitoring",
+]
+RESUME_TEMPLATE = """{name}
+Summary
+{title} with {years} years of experience building production services.
+Experience
+{title}, {company} - {skills}
+Education
+B.Tech Computer Science
+Skills
+{skills}
+Projects
+Job tracker - django, htmx, sqlite full text search
+"""
+
+
+def _choices(rng, weighted, k):
+    values, weights = zip(*weighted)
+    return rng.choices(values, weights=weights, k=k)
+
+
+def next_seed_number():
+    """One past the highest seed_user_<n> in use. Not count(): deleted seed users leave gaps,
+       and counting would hand out a number that is still taken."""
+    names = User.objects.filter(username__startswith=USERNAME_PREFIX).values_list("username", flat=True)
+    numbers = (name[len(USERNAME_PREFIX):] for name in names.iterator())
+    return max((int(n) for n in numbers if n.isdigit()), default=-1) + 1
+
+
+def seed_users(count, start=0, batch_size=SEED_BATCH_SIZE, staff=0):
+    """count users named seed_user_<n> from n = start, all sharing one password hash (hashing is the slow part).
+       The first `staff` of them are staff. Returns their ids in creation order."""
+    password = make_password(SEED_PASSWORD)
+    joined = timezone.now()
+    users = [
+        User(username=f"{USERNAME_PREFIX}{n:07d}", email=f"{USERNAME_PREFIX}{n:07d}@example.com",
+             password=password, is_staff=n - start < staff, date_joined=joined)
+        for n in range(start, start + count)
+    ]
+    with transaction.atomic():
+        User.objects.bulk_create(users, batch_size=batch_size)
+    if all(u.pk for u in users):  # backends with INSERT ... RETURNING (sqlite >= 3.35)
+        return [u.pk for u in users]
+    ids = dict(User.objects.filter(username__startswith=USERNAME_PREFIX).values_list("username", "id"))
+    return [ids[u.username] for u in users]
+
+
+def _job_rows(rng, user_id, count, today):
+    titles = [level + title for level, title in zip(rng.choices(LEVELS, k=count), rng.choices(TITLES, k=count))]
+    companies = rng.choices(COMPANIES, k=count)
+    statuses = _choices(rng, STATUSES, count)
+    priorities = _choices(rng, PRIORITIES, count)
+    sources = _choices(rng, SOURCES, count)
+    for i in range(count):
+        apply_date = today - timedelta(days=rng.randint(0, 365))
+        follow_up_date, done = None, False
+        roll = rng.random()
+        if roll < 0.35:
+            # open follow-ups around today so today/overdue/upcoming lists have rows
+            follow_up_date = today + timedelta(days=rng.randint(-20, 14))
+        elif roll < 0.5:
+            done = True
+        yield {
+            "user_id": user_id, "title": titles[i], "company": companies[i], "status": statuses[i],
+            "priority": priorities[i], "source": sources[i], "apply_date": apply_date,
+            "follow_up_date": follow_up_date, "follow_up_done": done,
+            "notes": rng.choice(NOTES), "next_step": rng.choice(NEXT_STEPS),
+            "rejection_reason": "Position filled" if statuses[i] == "rejected" and rng.random() < 0.5 else "",
+        }
+
+
+def seed_jobs_for(user_ids, jobs_per_user, seed=0, batch_size=SEED_BATCH_SIZE, progress=None):
+    """jobs_per_user jobs for each user, bulk inserted in batches with one transaction per batch.
+       Tokens are computed once per distinct title/company and notes/next step. Returns (jobs created, {user_id: [first job ids]})."""
+    rng = random.Random(seed)
+    today = timezone.localdate()
+    token_cache = {}
+    job_ids = {}
+    pending = []
+    created = 0
+
+    def flush():
+        nonlocal created
+        with transaction.atomic():
+            Job.objects.bulk_create(pending, batch_size=batch_size)
+        for job in pending:
+            ids = job_ids.setdefault(job.user_id, [])
+            if job.pk and len(ids) < KEEP_JOB_IDS:
+                ids.append(job.pk)
+        created += len(pending)
+        if progress:
+            progress(len(pending))
+        pending.clear()
+
+    for user_id in user_ids:
+        for row in _job_rows(rng, user_id, jobs_per_user, today):
+            job = Job(**row)
+            # match_text() is "title company notes next_step" and no skill phrase spans the two
+            # halves of these word lists, so the union equals keyword_set(job.match_text())
+            head, tail = (row["title"], row["company"]), (row["notes"], row["next_step"])
+            for key in (head, tail):
+                if key not in token_cache:
+                    token_cache[key] = set(keyword_set(" ".join(key)))
+            job.tokens = sorted(token_cache[head] | token_cache[tail])
+            pending.append(job)
+            if len(pending) >= batch_size:
+                flush()
+    if pending:
+        flush()
+    return created, job_ids
+
+
+def seed_activity(user_ids, job_ids, count, seed=0, batch_size=SEED_BATCH_SIZE, days=90, progress=None):
+    """count AdminActivity rows spread over the last `days` days, newest last.
+       job_ids comes from seed_jobs_for(); job actions point at one of the user's jobs."""
+    rng = random.Random(seed + 1)
+    if not user_ids or count <= 0:
+        return 0
+    now = timezone.now()
+    step = timedelta(days=days) / count
+    started = now - timedelta(days=days)
+    written = 0
+    while written < count:
+        size = min(batch_size, count - written)
+        actions = _choices(rng, ACTIONS, size)
+        batch = []
+        for i in range(size):
+            user_id = rng.choice(user_ids)
+            jobs = job_ids.get(user_id)
+            job_id = rng.choice(jobs) if jobs and actions[i] in ("job_created", "job_updated", "followup_done") else None
+            batch.append(AdminActivity(user_id=user_id, action=actions[i], job_id=job_id,
+                                       created_at=started + step * (written + i)))
+        with transaction.atomic():
+            AdminActivity.objects.bulk_create(batch, batch_size=batch_size)
+        written += size
+        if progress:
+            progress(size)
+    return written
+
+
+def resume_text(variant):
+    """Text of sample resume number `variant` (deterministic)."""
+    rng = random.Random(variant)
+    return RESUME_TEMPLATE.format(
+        name=RESUME_NAMES[variant % len(RESUME_NAMES)], title=rng.choice(LEVELS) + rng.choice(TITLES),
+        years=rng.randint(1, 15), company=rng.choice(COMPANIES), skills=RESUME_SKILLS[variant % len(RESUME_SKILLS)],
+    )
+
+
+def _pdf_escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def resume_pdf(text):
+    """A one-page PDF with `text` in Helvetica, one line per text line. Hand-written so
+       seeding needs no PDF library; pdfminer extracts it like an uploaded resume."""
+    lines = text.splitlines()
+    stream = "BT /F1 11 Tf 14 TL 56 780 Td\n" + "".join(f"({_pdf_escape(line)}) Tj T*\n" for line in lines) + "ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+def seed_resumes(user_ids, variants=3, processed=True):
+    """Write `variants` sample resume PDFs to storage and give each user one of them.
+       processed=True also stores the ResumeText (same result the pipeline would produce)
+       so the resume APIs work straight away; False leaves them pending for process_resumes."""
+    if not user_ids or variants <= 0:
+        return []
+    files = []
+    for variant in range(variants):
+        text = resume_text(variant)
+        content = resume_pdf(text)
+        sha = hashlib.sha256(content).hexdigest()
+        name = f"resumes/seed/sample_{variant}.pdf"
+        if default_storage.exists(name):
+            default_storage.delete(name)
+        name = default_storage.save(name, ContentFile(content))
+        if processed:
+            ResumeText.objects.update_or_create(sha256=sha, defaults={
+                "text": text, "tokens": keyword_set(text), **analyze_sections(text),
+            })
+        files.append((name, sha))
+
+    def profile(i, user_id):
+        name, sha = files[i % len(files)]
+        if processed:
+            return UserProfile(user_id=user_id, resume=name, resume_hash=sha, resume_status="ready")
+        return UserProfile(user_id=user_id, resume=name)
+
+    with transaction.atomic():
+        UserProfile.objects.bulk_create([profile(i, user_id) for i, user_id in enumerate(user_ids)],
+                                        batch_size=SEED_BATCH_SIZE)
+    return [name for name, _ in files]
+
+
+def rebuild_stats(user_ids):
+    """bulk_create skips the Job signals, so build the JobStats rollups here. Same numbers
+       as JobStats.compute() but two grouped queries over the id range instead of two per user."""
+    if not user_ids:
+        return
+    jobs = Job.objects.filter(user_id__gte=min(user_ids), user_id__lte=max(user_ids))
+    wanted = set(user_ids)
+    stats = {user_id: JobStats(user_id=user_id) for user_id in user_ids}
+    counts = jobs.values("user_id").order_by().annotate(
+        total=Count("id"),
+        first_apply_date=Min("apply_date"),
+        **{status: Count("id", filter=Q(status=status)) for status, _ in Job.STATUS_CHOICES},
+        **{priority: Count("id", filter=Q(priority=priority)) for priority, _ in Job.PRIORITY_CHOICES},
+    )
+    for row in counts:
+        if row["user_id"] in wanted:
+            for field, value in row.items():
+                setattr(stats[row["user_id"]], field, value)
+    open_follow_ups = (jobs.filter(follow_up_done=False, follow_up_date__isnull=False)
+                       .values_list("user_id", "follow_up_date").order_by().annotate(count=Count("id")))
+    for user_id, follow_up_date, count in open_follow_ups:
+        if user_id in wanted:
+            stats[user_id].follow_up_dates[follow_up_date.isoformat()] = count
+    with transaction.atomic():
+        JobStats.objects.bulk_create(stats.values(), batch_size=SEED_BATCH_SIZE)
+
+
+def seed_dataset(users, jobs_per_user, activity, seed=0, staff=1, resumes=3, batch_size=SEED_BATCH_SIZE, progress=None):
+    """Users, jobs, activity history, resumes and stats in one call. Same seed, same data
+       (dates are relative to today). Returns a summary dict."""
+    user_ids = seed_users(users, start=next_seed_number(), batch_size=batch_size, staff=staff)
+    jobs, job_ids = seed_jobs_for(user_ids, jobs_per_user, seed=seed, batch_size=batch_size, progress=progress)
+    activity_count = seed_activity(user_ids, job_ids, activity, seed=seed, batch_size=batch_size, progress=progress)
+    seed_resumes(user_ids, variants=resumes)
+    rebuild_stats(user_ids)
+    return {
+        "user_ids": user_ids,
+        "staff_ids": user_ids[:staff],
+        "jobs": jobs,
+        "activity": activity_count,
+    }
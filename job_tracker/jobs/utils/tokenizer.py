@@ -0,0 +1,89 @@
+import re
+
+# words with tech punctuation survive: c++, c#, node.js, ci/cd
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./][a-z0-9+#]+)*")
+URL_RE = re.compile(r"https?://\S+|www\.\S+|\S+@\S+")
+TRAILING_DOT_RE = re.compile(r"\.+$")
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each etc few for from further had has have
+having he her here hers herself him himself his how i if in into is it its itself just let me more most
+my myself no nor not now of off on once only or other our ours ourselves out over own per same she should
+so some such than that the their theirs them themselves then there these they this those through to too
+under until up very via was we were what when where which while who whom why will with within without
+would you your yours yourself yourselves
+job role position team company work working looking candidate candidates required requirements
+responsibilities preferred plus strong good excellent ability years year experience experienced
+""".split())
+
+# multi-word skills kept as one token, matched after stemming-free normalization
+SKILL_PHRASES = frozenset({
+    "machine learning", "deep learning", "data science", "data analysis", "data engineering",
+    "natural language processing", "computer vision", "artificial intelligence",
+    "project management", "product management", "software engineering", "software development",
+    "web development", "full stack", "front end", "back end", "unit testing", "test automation",
+    "continuous integration", "continuous delivery", "cloud computing", "google cloud",
+    "big data", "business intelligence", "power bi", "rest api", "react native", "spring boot",
+    "ruby on rails", "version control", "problem solving", "team leadership", "customer service",
+    "digital marketing", "supply chain", "quality assurance", "system design", "distributed systems",
+})
+MAX_PHRASE_LEN = max(len(p.split()) for p in SKILL_PHRASES)
+
+# light stemming: plurals and -ing only, tokens with tech punctuation are left alone
+NO_STEM = re.compile(r"[+#./0-9]")
+NO_STEM_WORDS = frozenset({
+    "kubernetes", "aws", "analytics", "statistics", "economics", "graphics", "pandas", "redis",
+    "jenkins", "postgres", "express", "ios", "windows", "devops", "mlops", "sales", "series", "news",
+})
+ES_PLURAL_RE = re.compile(r"(ch|sh|x|ss|z)es$")
+# singulars that end in -che/-she/-xe: their plural only drops the "s" (caches -> cache, not cach)
+E_SINGULARS = frozenset({
+    "cache", "niche", "avalanche", "headache", "cliche", "quiche", "moustache", "microfiche",
+})
+
+
+def stem(word: str) -> str:
+    if len(word) <= 3 or NO_STEM.search(word) or word in NO_STEM_WORDS:
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    if ES_PLURAL_RE.search(word):
+        return word[:-1] if word[:-1] in E_SINGULARS else word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    if word.endswith("ing") and len(word) >= 7:
+        return word[:-3]
+    return word
+
+
+def words(text: str) -> list:
+    """Lowercased raw words, punctuation stripped, urls/emails dropped."""
+    text = URL_RE.sub(" ", (text or "").lower())
+    return [TRAILING_DOT_RE.sub("", w) for w in TOKEN_RE.findall(text)]
+
+
+def tokenize(text: str) -> list:
+    """Normalized tokens: known skill phrases as single tokens, then stemmed,
+       stopword-free single words. Order follows the text."""
+    raw = words(text)
+    tokens = []
+    i = 0
+    while i < len(raw):
+        for size in range(min(MAX_PHRASE_LEN, len(raw) - i), 1, -1):
+            phrase = " ".join(raw[i:i + size])
+            if phrase in SKILL_PHRASES:
+                tokens.append(phrase)
+                i += size
+                break
+        else:
+            word = raw[i]
+            i += 1
+            if word and word not in STOPWORDS:
+                tokens.append(stem(word))
+    return tokens
+
+
+def keyword_set(text: str) -> list:
+    """Sorted unique tokens, the form we store in JSON fields."""
+    return sorted(set(tokenize(text)))
@@ -1,20 +1,32 @@
 from urllib import request
 from django.core.paginator import Paginator
-import csv
-from django.http import HttpResponse, JsonResponse
+import io
+import json
+import os
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
 from django.views.decorators.http import require_POST, require_GET
 from django.urls import reverse
 from django.utils import timezone
 import datetime
 from datetime import timedelta
 from django.shortcuts import render, redirect, get_object_or_404
-
-from jobs.utils.resume_parser import extract_text_from_pdf
-from .models import Job, AdminActivity, UserProfile, ResumeBuilder
-from django.db.models import Q, Case, When, Value, IntegerField, CharField
+from django.template.loader import render_to_string
+
+from jobs.utils.activity import log_activity
+from jobs.utils.resume_pipeline import claim_expired, enqueue_resume
+from jobs.utils.job_ranking import match_job, rank_jobs
+from jobs.utils.job_filters import filter_jobs, non_string_filters
+from jobs.utils.search import rank_expression
+from jobs.utils.pagination import keyset_paginate
+from jobs.utils.exports import JOB_COLUMNS, streaming_csv_response, user_export_queryset
+from jobs.utils.export_jobs import enqueue_export, export_payload
+from jobs.utils.job_import import import_jobs
+from jobs.utils.bulk_actions import BULK_ACTION_LIMIT, BulkActionError, apply_bulk_actions, parse_actions
+from .models import Job, ExportJob, JobStats, UserProfile, ResumeBuilder, ResumeText
+from django.db.models import Case, When, IntegerField
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import UserCreationForm
-from .forms import JobForm, CustomUserCreationForm, ResumeUploadForm, ResumeBuilderForm
+from .forms import JobForm, JobImportForm, CustomUserCreationForm, ResumeUploadForm, ResumeBuilderForm
 from django.contrib.auth import login
 from django.contrib.auth.models import User
 from django.core.mail import send_mail
@@ -24,11 +36,11 @@ from .tokens import email_verification_token
 # Create your views here.
 def home(request):
     if request.user.is_authenticated:
-        jobs = Job.objects.filter(user=request.user)
-        total_all = jobs.count()
-        total_applied = jobs.filter(status='applied').count()
-        total_interview = jobs.filter(status='interview').count()
-        total_offered = jobs.filter(status='offered').count()
+        counts = JobStats.for_user(request.user).as_counts(timezone.localdate())
+        total_all = counts['total_all']
+        total_applied = counts['total_applied']
+        total_interview = counts['total_interview']
+        total_offered = counts['total_offered']
     else:
         total_all = 0
         total_applied = 0
@@ -65,6 +77,15 @@ def verify_email(request, user_id, token):
     # return render(request, "registration/verify_invalid.html")
     return HttpResponse("Invalid or expired link", status=400)
 
+JOBS_PER_PAGE = 10
+#sort param -> keyset columns (field, descending); id last keeps the order unique
+KEYSET_SORTS = {
+    'id': [('id', False)], #default
+    'date': [('apply_date', False), ('id', False)], #older first
+    'date_desc': [('apply_date', True), ('id', True)], #newest first
+    'priority': [('priority_rank', False), ('apply_date', False), ('id', False)],
+}
+
 @login_required
 def job_list(request):
     status = request.GET.get('status') #read?status=...
@@ -75,58 +96,40 @@ def job_list(request):
 
     jobs = Job.objects.filter(user=request.user)
 
-    #stats before filtering for display
-    total_all = jobs.count()
-    total_applied = jobs.filter(status='applied').count()
-    total_interview = jobs.filter(status='interview').count()
-    total_rejected = jobs.filter(status='rejected').count()
-    total_offered = jobs.filter(status='offered').count()
-    
-    if status in ['applied','interview','rejected','offered']:
-        jobs = jobs.filter(status=status)
-    if q:
-        jobs = jobs.filter(Q(title__icontains=q) | Q(company__icontains=q))
-
     #always set today once
     today = timezone.localdate()
 
-    if date_range == 'today':
-        today = timezone.localdate()
-        jobs = jobs.filter(apply_date=today)
-    elif date_range == 'week':
-        today = timezone.localdate()
-        start_week = today - timedelta(days=today.weekday())
-        end_week = start_week + timedelta(days=6)
-        jobs = jobs.filter(apply_date__range=[start_week, end_week])
-
-    if follow == 'today':
-        jobs = jobs.filter(follow_up_date=today,follow_up_done=False)
-    elif follow == 'overdue':
-        jobs = jobs.filter(follow_up_date__lt=today,follow_up_done=False)
-    elif follow == 'week':
-        start = today
-        end = today + timedelta(days=6)
-        jobs = jobs.filter(follow_up_date__range=(start, end),follow_up_done=False)
-
-    if sort == 'date':
-        jobs = jobs.order_by('apply_date')   #older first
-    elif sort == 'date_desc':
-        jobs = jobs.order_by('-apply_date') #newest first
-    elif sort == 'priority':
+    #stats before filtering for display (precomputed rollup, one pk read)
+    counts = JobStats.for_user(request.user).as_counts(today)
+
+    jobs = filter_jobs(jobs, request.GET, today)
+
+    if sort == 'priority':
         priority_order = Case(
             When(priority='high', then=1),
             When(priority='medium', then=2),
             When(priority='low', then=3),
             output_field=IntegerField(),
         )
-        jobs = jobs.order_by(priority_order, 'apply_date')
+        jobs = jobs.annotate(priority_rank=priority_order)
+
+    #pagination: keyset (cursor) for the fixed sorts, deep pages cost the same as page 1;
+    #?page=N links and relevance ordering still use the offset paginator
+    keys = KEYSET_SORTS.get(sort or 'id')
+    if q and not sort and rank_expression(q) is not None:
+        keys = None
+    if keys and 'page' not in request.GET:
+        page_obj = keyset_paginate(jobs, keys, request.GET.get('cursor'), JOBS_PER_PAGE)
     else:
-        jobs = jobs.order_by('id') #default
-
-    #pagination
-    paginator = Paginator(jobs,10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+        if keys:
+            jobs = jobs.order_by(*[('-' if desc else '') + field for field, desc in keys])
+        elif q and not sort:
+            jobs = jobs.annotate(search_rank=rank_expression(q)).order_by('search_rank', 'id') #best match first
+        else:
+            jobs = jobs.order_by('id') #default
+        paginator = Paginator(jobs,JOBS_PER_PAGE)
+        page_number = request.GET.get('page')
+        page_obj = paginator.get_page(page_number)
 
     for job in page_obj.object_list:
         if job.follow_up_done:
@@ -144,8 +147,8 @@ def job_list(request):
     profile = UserProfile.objects.filter(user=request.user).first()
 
 
-    return render(request, 'jobs/job_list.html', {'jobs': page_obj.object_list,'page_obj': page_obj, 'current_status':status, 'current_q':q, 'current_date_range':date_range,'current_sort':sort,'current_follow': follow, 'total_all':total_all,
-     'total_applied':total_applied, 'total_interview':total_interview, 'total_rejected':total_rejected, 'total_offered':total_offered, 'today': today,  'profile': profile,})
+    return render(request, 'jobs/job_list.html', {'jobs': page_obj.object_list,'page_obj': page_obj, 'current_status':status, 'current_q':q, 'current_date_range':date_range,'current_sort':sort,'current_follow': follow, 'total_all':counts['total_all'],
+     'total_applied':counts['total_applied'], 'total_interview':counts['total_interview'], 'total_rejected':counts['total_rejected'], 'total_offered':counts['total_offered'], 'today': today,  'profile': profile,})
 
 @login_required
 def followup_list(request):
@@ -174,7 +177,7 @@ def job_create(request):
             job = form.save(commit=False)
             job.user = request.user
             job.save()
-            AdminActivity.objects.create(user=request.user, action="job_created", job=job)  
+            log_activity(request.user, "job_created", job)
             return redirect('job_detail', pk=job.pk)
     else:
         form = JobForm()
@@ -190,7 +193,7 @@ def job_update(request,pk):
             if job.follow_up_date:
               job.follow_up_done = False   # enforce invariant
             job.save()
-            AdminActivity.objects.create(user=request.user, action="job_updated", job=job)
+            log_activity(request.user, "job_updated", job)
             return redirect('job_detail',pk=job.pk)
     else:
         form = JobForm(instance=job)
@@ -206,108 +209,133 @@ def job_delete(request, pk):
 
 @login_required
 def export_jobs_csv(request):
-    status = request.GET.get('status')
-    q = request.GET.get('q')
-    date_range = request.GET.get('date') #optional: 'today' or 'week'
-    follow = request.GET.get('follow')
-    if request.user.is_staff:
-      jobs = Job.objects.all()
-    else:
-      jobs = Job.objects.filter(user=request.user)
-
+    #staff export everyone's jobs, same filters as the list the export link was clicked from
+    jobs = user_export_queryset(request.user, request.GET)
 
-    if status in ['applied','interview','rejected','offered']:
-        jobs = jobs.filter(status=status)
-    if q:
-        jobs = jobs.filter(Q(title__icontains=q) | Q(company__icontains=q))
-
-    if date_range == 'today':
-        today = timezone.localdate()
-        jobs = jobs.filter(apply_date=today)
-    elif date_range == 'week':
-        today = timezone.localdate()
-        start_week = today - datetime.timedelta(days=today.weekday())
-        end_week = start_week + datetime.timedelta(days=6)
-        jobs = jobs.filter(apply_date__range=[start_week, end_week])
+    #I am sending a csv file,download it...don't show it on screen,save it as jobs.csv
+    #rows are streamed in chunks so memory stays flat for any table size
+    return streaming_csv_response(jobs, JOB_COLUMNS, 'jobs.csv')
 
+@login_required
+@require_POST
+def export_jobs_async(request):
+    """Queue an export with the export_jobs_csv filters, poll export_status for the file."""
+    fmt = request.POST.get('format', 'csv')
+    if fmt not in dict(ExportJob.FORMAT_CHOICES):
+        return JsonResponse({"error": "Unknown format"}, status=400)
+    export = enqueue_export(request.user, 'user', fmt, request.POST)
+    return JsonResponse(export_payload(export), status=202)
 
-    #I am sending a csv file,download it...don't show it on screen,save it as jobs.csv
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = 'attachment; filename="jobs.csv"'
+@login_required
+@require_GET
+def export_status(request, pk):
+    export = get_object_or_404(ExportJob, pk=pk, user=request.user)
+    return JsonResponse(export_payload(export))
 
-    #this object helps write rows into csv
-    writer = csv.writer(response)
-    #this is the first row inside csv file
-    writer.writerow(['ID', 'Title', 'Company', 'Status', 'Priority','Apply Date', 'Follow-up Date', 'Next Step','Contact Name', 'Contact Email', 'Contact Phone','Job URL', 'Source','Notes', 'Rejection Reason',])
-    
-    #write each job as a row
-    for job in jobs:
-        apply_date = job.apply_date.isoformat() if getattr(job, 'apply_date', None) else ''
-        follow_up = job.follow_up_date.isoformat() if getattr(job, 'follow_up_date', None) else ''
-        writer.writerow([job.id,job.title,job.company,job.status,job.get_priority_display(),apply_date,follow_up,
-                         job.next_step or '', job.contact_name or '',job.contact_email or '',job.contact_phone or '',
-                        job.job_url or '',job.get_source_display() if getattr(job, 'source', None) else '',
-                        job.notes or '', job.rejection_reason or '',])
+@login_required
+@require_GET
+def export_download(request, pk):
+    export = get_object_or_404(ExportJob, pk=pk, user=request.user, status='ready')
+    if export.expires_at <= timezone.now() or not export.file or not os.path.isfile(export.file.path):
+        raise Http404("Export expired")
+    content_type = 'text/csv' if export.format == 'csv' else 'application/x-ndjson'
+    return FileResponse(export.file.open('rb'), as_attachment=True,
+                        filename=f"jobs_export_{export.pk}.{export.format}", content_type=content_type)
 
-    return response
+@login_required
+def job_import(request):
+    result = None
+    if request.method == 'POST':
+        form = JobImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            #read the upload as text row by row, utf-8-sig also handles excel's BOM
+            fh = io.TextIOWrapper(form.cleaned_data['file'].file, encoding='utf-8-sig', newline='')
+            try:
+                result = import_jobs(fh, request.user)
+            except UnicodeDecodeError:
+                form.add_error('file', "File is not UTF-8 encoded.")
+    else:
+        form = JobImportForm()
+    return render(request, 'jobs/job_import.html', {'form': form, 'result': result})
 
 @login_required
 def stats_view(request):
     today = timezone.localdate()
     jobs = Job.objects.filter(user=request.user)
 
-    total_all = jobs.count()
-    total_applied = jobs.filter(status='applied').count()
-    total_interview = jobs.filter(status='interview').count()
-    total_rejected = jobs.filter(status='rejected').count()
-    total_offered = jobs.filter(status='offered').count()
+    counts = JobStats.for_user(request.user).as_counts(today)
+    #this week range(Mon-Sun), the only date window not kept in JobStats
+    start_week = today - timedelta(days=today.weekday())
+    end_week = start_week + timedelta(days=6)
+    applied_this_week = jobs.filter(status='applied',apply_date__range=[start_week, end_week]).count()
+    total_applied = counts['total_applied']
+    total_interview = counts['total_interview']
+    total_offered = counts['total_offered']
 
-    follow_today = jobs.filter(follow_up_date=today, follow_up_done=False).count()
-    follow_overdue = jobs.filter( follow_up_date__lt=today, follow_up_done=False).count()
     #conversion rates(avoid division by 0)
     applied_to_interview = ((total_interview/total_applied)*100 if total_applied else 0)
     interview_to_offer = ((total_offered/total_interview)*100 if total_interview else 0)
-    #in_progress(pipeline:not rejected, not offered)
-    in_progress = jobs.exclude(status__in=['rejected','offered']).count()
-    #this week range(Mon-Sun)
-    start_week = today - timedelta(days=today.weekday())
-    end_week = start_week + timedelta(days=6)
-    applied_this_week = jobs.filter(status='applied',apply_date__range=[start_week, end_week]).count()
     #average applications per day since first apply
-    first_job = jobs.order_by('apply_date').first()
-    if first_job and first_job.apply_date:
-        days_span = (today - first_job.apply_date).days + 1
+    first_apply_date = counts['first_apply_date']
+    if first_apply_date:
+        days_span = (today - first_apply_date).days + 1
         avg_applied_per_day = total_applied / days_span if days_span > 0 else total_applied
     else:
         avg_applied_per_day = 0
 
     context = {
         'today': today,
-        'total_all': total_all,
+        'total_all': counts['total_all'],
         'total_applied': total_applied,
         'total_interview': total_interview,
-        'total_rejected': total_rejected,
+        'total_rejected': counts['total_rejected'],
         'total_offered': total_offered,
-        'follow_today': follow_today,
-        'follow_overdue': follow_overdue,
+        'follow_today': counts['follow_today'],
+        'follow_overdue': counts['follow_overdue'],
         'applied_to_interview': applied_to_interview,
         'interview_to_offer': interview_to_offer,
-        'in_progress': in_progress,
+        'in_progress': counts['in_progress'],
         'applied_this_week': applied_this_week,
         'avg_applied_per_day': avg_applied_per_day,
     }
     return render(request, 'jobs/stats.html', context)
 
+def fragment_mode(request):
+    """'html' / 'json' when the caller wants a partial response instead of a redirect:
+       ?fragment=html|json, or an Accept: application/json header."""
+    mode = request.GET.get("fragment")
+    if mode in ("html", "json"):
+        return mode
+    if "application/json" in request.headers.get("Accept", ""):
+        return "json"
+    return None
+
+def quick_edit_response(request, job, template, valid):
+    """Redirect back for plain form posts; otherwise only the re-rendered cell
+       (html) or the cell plus the updated summary counters (json). valid=False
+       (value not allowed) is a 400 for fragment callers."""
+    mode = fragment_mode(request)
+    if mode is None:
+        return redirect(request.META.get("HTTP_REFERER", reverse("job_list")))
+    if not valid:
+        return JsonResponse({"error": "Invalid value"}, status=400)
+    html = render_to_string(template, {"job": job}, request=request)
+    if mode == "html":
+        return HttpResponse(html)
+    counts = JobStats.for_user(request.user).as_counts(timezone.localdate())
+    return JsonResponse({"id": job.pk, "status": job.status, "priority": job.priority, "html": html, "counts": counts})
+
 @login_required
 @require_POST
 def job_quick_status(request, pk):
     job = get_object_or_404(Job, pk=pk, user=request.user)
 
     new_status = request.POST.get("status")
-    if new_status in ["applied", "interview", "rejected", "offered"]:
+    valid = new_status in ["applied", "interview", "rejected", "offered"]
+    if valid and new_status != job.status:
         job.status = new_status
-        job.save()
-    return redirect(request.META.get("HTTP_REFERER", reverse("job_list")))
+        job.save(update_fields=["status"])
+    return quick_edit_response(request, job, "jobs/partials/job_status_cell.html", valid)
 
 @login_required
 @require_POST
@@ -315,10 +343,11 @@ def job_quick_priority(request, pk):
     job = get_object_or_404(Job, pk=pk, user=request.user)
 
     new_priority = request.POST.get("priority")
-    if new_priority in ["high","medium","low"]:
+    valid = new_priority in ["high","medium","low"]
+    if valid and new_priority != job.priority:
         job.priority = new_priority
-        job.save()
-    return redirect(request.META.get("HTTP_REFERER", reverse("job_list")))
+        job.save(update_fields=["priority"])
+    return quick_edit_response(request, job, "jobs/partials/job_priority_cell.html", valid)
 
 @login_required
 @require_POST
@@ -327,7 +356,7 @@ def job_followup_done(request,pk):
     job.follow_up_date = None
     job.follow_up_done = True  #Done ≠ Never set
     job.save()
-    AdminActivity.objects.create(user=request.user, action="followup_done", job=job)
+    log_activity(request.user, "followup_done", job)
     return HttpResponse(status=204)
 
 @login_required
@@ -342,6 +371,41 @@ def job_followup_quick_update(request, pk):
         job.save()
     return HttpResponse(status=204)
 
+@login_required
+@require_POST
+def job_bulk_action(request):
+    """Change many jobs at once.
+       Body: {"job_ids": [...]} or {"filter": {...}} plus any of
+       "status", "priority", "follow_up_date" (YYYY-MM-DD or null), "follow_up_done": true"""
+    try:
+        payload = json.loads(request.body or "{}")
+    except ValueError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    jobs = Job.objects.filter(user=request.user)
+    if "job_ids" in payload:
+        try:
+            job_ids = [int(i) for i in payload["job_ids"]]
+        except (TypeError, ValueError):
+            return JsonResponse({"error": "job_ids must be a list of integers"}, status=400)
+        jobs = jobs.filter(id__in=job_ids[:BULK_ACTION_LIMIT + 1])
+    elif isinstance(payload.get("filter"), dict):
+        bad = non_string_filters(payload["filter"])
+        if bad:
+            return JsonResponse({"error": f"Filter values must be strings: {', '.join(bad)}"}, status=400)
+        jobs = filter_jobs(jobs, payload["filter"], timezone.localdate())
+    else:
+        return JsonResponse({"error": "Provide job_ids or filter"}, status=400)
+
+    try:
+        updated = apply_bulk_actions(request.user, jobs, parse_actions(payload))
+    except BulkActionError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    counts = JobStats.for_user(request.user).as_counts(timezone.localdate())
+    return JsonResponse({"updated": updated, "counts": counts})
+
 @login_required
 def resume_upload(request):
     profile, created = UserProfile.objects.get_or_create(user=request.user)
@@ -349,16 +413,36 @@ def resume_upload(request):
     if request.method == 'POST':
         form = ResumeUploadForm(request.POST, request.FILES, instance=profile)
         if form.is_valid():
-            form.save()
+            profile = form.save()
+            if profile.resume:
+                enqueue_resume(profile.pk)
 
             action = "resume_uploaded" if not old_resume else "resume_updated"
 
-            AdminActivity.objects.create(user=request.user, action=action, job=None)
+            log_activity(request.user, action)
             return redirect('job_list')
     else:
         form = ResumeUploadForm(instance=profile)
     return render(request, 'jobs/resume_upload.html', {'form': form, 'profile': profile})  
 
+BATCH_MATCH_LIMIT = 500
+
+def processed_resume(profile):
+    """ResumeText for a processed resume, or None while it is still queued/failed.
+       Resumes uploaded before the pipeline existed get queued on first access, and so
+       do ones whose worker died mid-way (claim_expired)."""
+    if profile.resume_status == "pending" or claim_expired(profile):
+        enqueue_resume(profile.pk)
+        return None
+    if profile.resume_status != "ready":
+        return None
+    resume = ResumeText.objects.filter(sha256=profile.resume_hash).first()
+    if resume is None:
+        # cache row was cleaned up underneath us, process the file again
+        UserProfile.objects.filter(pk=profile.pk, resume_status="ready").update(resume_status="pending")
+        enqueue_resume(profile.pk)
+    return resume
+
 @login_required
 @require_GET
 def resume_checker_api(request):
@@ -367,33 +451,18 @@ def resume_checker_api(request):
     if not profile or not profile.resume:
         return JsonResponse({"has_resume": False, "message": "No resume uploaded."}, status=404)
     
-    # Read + extract resume text
-    text = extract_text_from_pdf(profile.resume.path)
-    if not text:
+    # results are computed at upload time by the background pipeline
+    resume = processed_resume(profile)
+    if resume is None:
+        if profile.resume_status == "failed":
+            return JsonResponse({"has_resume": True, "error": "Could not extract resume text", "reason": profile.resume_error}, status=400)
+        return JsonResponse({"has_resume": True, "status": "processing", "resume_name": profile.resume.name}, status=202)
+    if not resume.text:
         return JsonResponse({"has_resume": True, "error": "Could not extract resume text"}, status=400)
-    
-    # Sections to Check
-    sections = {
-        "Education" : ["education"],
-        "Experience": ["experience", "work experience"],
-        "Projects": ["projects", "project"],
-        "Skills": ["skills", "technical skills"],
-        "Summary": ["summary", "profile"],
-    }
-
-    sections_found = []
-    missing_sections = []
 
-    for section, keywords in sections.items():
-        if any(k in text.lower() for k in keywords):
-            sections_found.append(section)
-        else:
-            missing_sections.append(section)
-    # 3️⃣ REAL SCORE (NO HARDCODE)
-    # 5 sections → each = 20 points
-    score = len(sections_found) * 20
-    if score > 100:
-        score = 100
+    score = resume.score
+    sections_found = resume.sections_found
+    missing_sections = resume.missing_sections
 
     # 4️⃣ Suggestions (based on missing sections)
     suggestions = [
@@ -404,10 +473,12 @@ def resume_checker_api(request):
     # 5️⃣ Return JSON
     return JsonResponse({
         "has_resume": True,
+        "status": "ready",
         "resume_name": profile.resume.name,
         "score": score,
         "sections_found": sections_found,
         "missing_sections": missing_sections,
+        "section_details": resume.section_details,
         "suggestions": suggestions,
     })
 
@@ -420,32 +491,82 @@ def resume_job_match_api(request, job_id):
     if not profile or not profile.resume:
         return JsonResponse({"error": "No resume uploaded"}, status=400)
 
-    resume_text = extract_text_from_pdf(profile.resume.path).lower()
-    job_text = (
-        f"{job.title} {job.company} {job.notes or ''} "
-        f"{job.next_step or ''}"
-    ).lower()
-
-    if not resume_text:
+    resume = processed_resume(profile)
+    if resume is None:
+        if profile.resume_status == "failed":
+            return JsonResponse({"error": "Resume text not readable", "reason": profile.resume_error}, status=400)
+        return JsonResponse({"status": "processing"}, status=202)
+    if not resume.text:
         return JsonResponse({"error": "Resume text not readable"}, status=400)
 
-    # simple keyword extraction
-    resume_words = set(resume_text.split())
-    job_words = set(job_text.split())
-
-    common = resume_words.intersection(job_words)
-    missing = job_words - resume_words
-
-    match_percent = int((len(common) / max(len(job_words), 1)) * 100)
-
     return JsonResponse({
-        "job": job.title,
-        "match_percent": match_percent,
-        "matched_keywords": list(common)[:20],
-        "missing_keywords": list(missing)[:20],
+        **match_job(set(resume.tokens), job),
         "suggestion": "Add missing keywords to resume for better ATS match"
     })
 
+@login_required
+@require_POST
+def resume_job_match_batch_api(request):
+    """Match results for many jobs in one call.
+       Body: {"job_ids": [1, 2, ...]} or {"filter": {"status": ..., "q": ..., "date": ..., "follow": ...}}"""
+    try:
+        payload = json.loads(request.body or "{}")
+    except ValueError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    jobs = Job.objects.filter(user=request.user)
+    if "job_ids" in payload:
+        try:
+            job_ids = [int(i) for i in payload["job_ids"]]
+        except (TypeError, ValueError):
+            return JsonResponse({"error": "job_ids must be a list of integers"}, status=400)
+        jobs = jobs.filter(id__in=job_ids)
+    elif isinstance(payload.get("filter"), dict):
+        bad = non_string_filters(payload["filter"])
+        if bad:
+            return JsonResponse({"error": f"Filter values must be strings: {', '.join(bad)}"}, status=400)
+        jobs = filter_jobs(jobs, payload["filter"], timezone.localdate())
+    else:
+        return JsonResponse({"error": "Provide job_ids or filter"}, status=400)
+
+    profile = UserProfile.objects.filter(user=request.user).first()
+    if not profile or not profile.resume:
+        return JsonResponse({"error": "No resume uploaded"}, status=400)
+    resume = processed_resume(profile)
+    if resume is None:
+        if profile.resume_status == "failed":
+            return JsonResponse({"error": "Resume text not readable", "reason": profile.resume_error}, status=400)
+        return JsonResponse({"status": "processing"}, status=202)
+
+    # one query for the jobs, one resume token set for all of them
+    resume_words = set(resume.tokens)
+    jobs = jobs.only("id", "title", "tokens").order_by("id")[:BATCH_MATCH_LIMIT]
+    return JsonResponse({"results": {job.id: match_job(resume_words, job) for job in jobs}})
+
+@login_required
+@require_GET
+def resume_rank_api(request):
+    profile = UserProfile.objects.filter(user=request.user).first()
+    if not profile or not profile.resume:
+        return JsonResponse({"error": "No resume uploaded"}, status=400)
+
+    resume = processed_resume(profile)
+    if resume is None:
+        if profile.resume_status == "failed":
+            return JsonResponse({"error": "Resume text not readable", "reason": profile.resume_error}, status=400)
+        return JsonResponse({"status": "processing"}, status=202)
+
+    try:
+        top_n = max(1, min(int(request.GET.get("top", 20)), 100))
+    except ValueError:
+        top_n = 20
+
+    # one query for all jobs, one pass to score them
+    jobs = Job.objects.filter(user=request.user).only("id", "title", "company", "tokens")
+    return JsonResponse({"results": rank_jobs(resume.tokens, jobs, top_n=top_n)})
+
 @login_required
 def resume_builder(request):
     resume, _ = ResumeBuilder.objects.get_or_create(user=request.user, defaults={"full_name": request.user.get_full_name(), "email": request.user.email,})
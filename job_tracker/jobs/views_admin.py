@@ -1,47 +1,54 @@
 import django
-import csv
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.models import User
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, F, OuterRef, Q
 from django.shortcuts import render, redirect, get_object_or_404
 from django.utils import timezone
+import datetime
 from datetime import timedelta
-from .models import Job, AdminActivity, UserProfile
-from django.http import HttpResponse, HttpResponseForbidden
+from .models import Job, AdminActivity, ExportJob, UserProfile
+from .utils.job_filters import STATUSES
+from .utils.job_stats import job_counts
+from .utils.search import rank_expression, search_q
+from .utils.pagination import keyset_paginate
+from .utils.activity import log_activity
+from .utils import metrics, perf
+from .utils.rate_limit import get_client_ip
+from .utils.resume_parser import extraction_stats
+from .utils.exports import ADMIN_JOB_COLUMNS, admin_export_queryset, streaming_csv_response
+from .utils.export_jobs import enqueue_export, export_payload
+from .utils.analytics_export import DATASETS, column_names, ndjson_batch, record_batches
+from django.http import Http404, HttpResponse, HttpResponseForbidden, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_POST
 
 @staff_member_required
 def admin_dashboard(request):
 
-    total_users = User.objects.count()
-    total_jobs = Job.objects.count()
+    # Active user count - logged in last 30 days
+    thirty_days_ago = timezone.now() - timedelta(days=30)
+    user_counts = User.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(last_login__gte=thirty_days_ago)),
+        no_jobs=Count('id', filter=~Exists(Job.objects.filter(user=OuterRef('pk')))),
+    )
+    today = timezone.localdate()
+    counts = job_counts(Job.objects.all(), today)
 
     # Status breakdown
-    status_stats = Job.objects.values('status').annotate(count=Count('status'))
+    status_stats = [{'status': status, 'count': counts[f'total_{status}']} for status in STATUSES if counts[f'total_{status}']]
 
     # Top companies
     top_companies = Job.objects.values('company').annotate(count=Count('company')).order_by('-count')[:5]
 
-    # Active user count - logged in last 30 days
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-    active_users = User.objects.filter(last_login__gte=thirty_days_ago).count()
-
-    # Users with no jobs
-    users_with_no_jobs = total_users - Job.objects.values('user').distinct().count()
-
-    # Follow-ups summary
-    today = timezone.now().date()
-    follow_today = Job.objects.filter(follow_up_date=today, follow_up_done=False).count()
-    follow_overdue = Job.objects.filter(follow_up_date__lt=today, follow_up_done=False).count()
-
     context = {
-        "total_users": total_users,
-        "total_jobs": total_jobs,
-        "active_users": active_users,
-        "users_with_no_jobs": users_with_no_jobs,
+        "total_users": user_counts["total"],
+        "total_jobs": counts["total_all"],
+        "active_users": user_counts["active"],
+        "users_with_no_jobs": user_counts["no_jobs"],
         "status_stats": status_stats,
         "top_companies": top_companies,
-        "follow_today": follow_today,
-        "follow_overdue": follow_overdue,
+        "follow_today": counts["follow_today"],
+        "follow_overdue": counts["follow_overdue"],
     }
 
     return render(request, "jobs/admin_dashboard.html", context)
@@ -64,7 +71,7 @@ def admin_job_list(request):
          if user_id:
              jobs = jobs.filter(user_id=user_id)
          if q:
-             jobs = jobs.filter(Q(title__icontains=q) | Q(company__icontains=q) | Q(user__username__icontains=q))
+             jobs = jobs.filter(search_q(q) | Q(user__username__icontains=q))
 
          today = timezone.localdate()
          if follow == "today":
@@ -72,16 +79,31 @@ def admin_job_list(request):
          elif follow == "overdue":
              jobs = jobs.filter(follow_up_date__lt=today, follow_up_done=False)
 
-         context.update({"jobs": jobs.order_by("-id"), "users": User.objects.all().order_by("username"), "current_status": status, "current_user": user_id, "current_q": q, "current_follow": follow})
+         rank = rank_expression(q) if q else None
+         jobs = jobs.annotate(search_rank=rank).order_by(F("search_rank").asc(nulls_last=True), "-id") if rank is not None else jobs.order_by("-id")
+
+         context.update({"jobs": jobs, "users": User.objects.all().order_by("username"), "current_status": status, "current_user": user_id, "current_q": q, "current_follow": follow})
     elif mode == "users":
          context["users"] = (User.objects.annotate(job_count=Count("job")).select_related("profile").order_by("username"))
     elif mode == "no_jobs":
          context["users"] = (User.objects.annotate(job_count=Count("job")).filter(job_count=0).order_by("username"))
     return render(request, "jobs/admin_job_list.html", context)
 
+ACTIVITY_PER_PAGE = 50
+ACTIVITY_KEYS = [("created_at", True), ("id", True)] # newest first
+
+def _day_start(value):
+    """'YYYY-MM-DD' -> aware datetime at local midnight, None if invalid."""
+    try:
+        day = datetime.date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
 @staff_member_required
 def admin_activity_timeline(request):
-    activities = AdminActivity.objects.select_related("user", "job").order_by("-created_at")
+    # compact rows: no model instances, just the columns the template shows
+    activities = AdminActivity.objects.values("id", "created_at", "action", "user__username", "job__title", "job__company", "details")
     user_id = request.GET.get("user")
     action = request.GET.get("action")
     date_from = request.GET.get("date_from")
@@ -91,13 +113,24 @@ def admin_activity_timeline(request):
         activities = activities.filter(user_id=user_id)
     if action:
         activities = activities.filter(action=action)
-    if date_from:
-        activities = activities.filter(created_at__date__gte=date_from)
-    if date_to:
-        activities = activities.filter(created_at__date__lte=date_to)
+    # half-open datetime ranges so the created_at indexes stay usable
+    start = _day_start(date_from)
+    if start:
+        activities = activities.filter(created_at__gte=start)
+    end = _day_start(date_to)
+    if end:
+        # next local midnight, not +24h: days around a DST change are 23 or 25 hours long
+        activities = activities.filter(created_at__lt=_day_start((end.date() + timedelta(days=1)).isoformat()))
+
+    page_obj = keyset_paginate(activities, ACTIVITY_KEYS, request.GET.get("cursor"), ACTIVITY_PER_PAGE)
+    action_labels = dict(AdminActivity.ACTION_CHOICES)
+    for row in page_obj.object_list:
+        row["action_label"] = action_labels.get(row["action"], row["action"])
+
     context = {
-        "activities": activities[:200],  # safety limit
-        "users": User.objects.order_by("username"),
+        "activities": page_obj.object_list,
+        "page_obj": page_obj,
+        "users": User.objects.order_by("username").only("id", "username"),
         "actions": AdminActivity.ACTION_CHOICES,
         "current_user": user_id,
         "current_action": action,
@@ -122,31 +155,54 @@ def admin_toggle_user_active(request, user_id):
     user.save()
 
     # log admin activity
-    AdminActivity.objects.create(
-        user=request.user,        # admin who performed action
-        action=action,
-        job=None                  # no job involved
-    )
+    log_activity(request.user, action)  # admin who performed action, no job involved
 
     return redirect(request.META.get("HTTP_REFERER", "/admin-dashboard/"))
 
 @staff_member_required
 def admin_export_jobs_csv(request):
     user_id = request.GET.get("user")
-    jobs = Job.objects.select_related("user")
-
-    if user_id:
-        jobs = jobs.filter(user_id=user_id)
-
-    response = HttpResponse(content_type="text/csv")
     filename = "jobs_all_users.csv" if not user_id else f"user_{user_id}_jobs.csv"
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return streaming_csv_response(admin_export_queryset(request.GET), ADMIN_JOB_COLUMNS, filename)
 
-    writer = csv.writer(response)
-    writer.writerow(["User","Title","Company","Status","Priority","Apply Date","Follow-up Date",])
+@staff_member_required
+@require_POST
+def admin_export_jobs_async(request):
+    """Background version of admin_export_jobs_csv; poll the returned status_url."""
+    fmt = request.POST.get("format", "csv")
+    if fmt not in dict(ExportJob.FORMAT_CHOICES):
+        return JsonResponse({"error": "Unknown format"}, status=400)
+    export = enqueue_export(request.user, "admin", fmt, request.POST)
+    return JsonResponse(export_payload(export), status=202)
 
-    for job in jobs:
-        writer.writerow([
-            job.user.username,job.title,job.company,job.status,job.priority,job.apply_date,job.follow_up_date or "",
-            ])
-    return response
\ No newline at end of file
+@staff_member_required
+def admin_analytics_export(request, dataset):
+    """NDJSON feed of jobs / activity for analysts; ?since_id= returns only newer rows."""
+    if dataset not in DATASETS:
+        raise Http404("Unknown dataset")
+    try:
+        since_id = max(int(request.GET.get("since_id", 0)), 0)
+    except ValueError:
+        since_id = 0
+    names = column_names(dataset)
+    lines = (ndjson_batch(names, batch) for batch in record_batches(dataset, since_id))
+    response = StreamingHttpResponse(lines, content_type="application/x-ndjson")
+    response["Content-Disposition"] = f'attachment; filename="{dataset}_after_{since_id}.ndjson"'
+    return response
+
+@staff_member_required
+def admin_performance(request):
+    """Rolling request timings per url name, collected by PerformanceMiddleware in this worker."""
+    return render(request, "jobs/admin_performance.html", {
+        "routes": perf.summary(),
+        "sample_size": perf.perf_settings()["SAMPLE_SIZE"],
+        "pdf": extraction_stats(),
+    })
+
+def metrics_view(request):
+    """Prometheus scrape endpoint: staff sessions or METRICS['ALLOWED_IPS']."""
+    # X-Forwarded-For is client supplied, only read behind LOGIN_RATE_LIMIT['TRUSTED_PROXIES']
+    allowed = get_client_ip(request) in metrics.metrics_settings()["ALLOWED_IPS"]
+    if not allowed and not (request.user.is_authenticated and request.user.is_staff):
+        return HttpResponseForbidden("Forbidden")
+    return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")